@@ -0,0 +1,106 @@
+# p2app/engine/event_handlers.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Handler objects that the engine looks up by event type.  Each one knows which
+# operation to run, which table it runs on, and how to build the events sent
+# back to the user interface, so new kinds of records can be supported by
+# registering new handlers rather than by changing Engine.process_event.
+
+import os
+import sqlite3
+
+from p2app.engine.utility_functions import open_database
+from p2app.engine.utility_functions import precompile_statements
+from p2app.engine.utility_functions import set_record_cache_size
+from p2app.events import DisableProfilingEvent, EnableProfilingEvent, ErrorEvent
+
+
+
+class EngineHandler:
+    """Handles one type of event sent to the engine, turning the records produced by
+    its operation into result events"""
+
+    def __init__(self, result_event, failure_event, operation = None, geo_scope: str | None = None,
+                 timeout: float | None = None):
+        """Initializes the handler; result_event is called with each record produced by
+        the operation (or with nothing if there is no operation), and failure_event is
+        either a fixed ErrorEvent or called with the reason for the failure.  The
+        operation is stopped after timeout seconds, or after the engine's default
+        timeout if none is given"""
+        self.result_event = result_event
+        self.failure_event = failure_event
+        self.operation = operation
+        self.geo_scope = geo_scope
+        self.timeout = timeout
+
+        if geo_scope is not None:
+            precompile_statements(geo_scope)
+
+
+    def handle(self, event, engine):
+        """A generator function that yields the result events for one event"""
+        if self.operation is None:
+            yield self.result_event()
+            return
+
+        result = self.operation(event, self.geo_scope, engine.connection)
+        if isinstance(result, str):
+            raise sqlite3.Error(result)
+        for record in result:
+            yield self.result_event(record)
+
+
+    def failure(self, error: sqlite3.Error):
+        """Builds the event that reports a failure to the user interface"""
+        if isinstance(self.failure_event, ErrorEvent):
+            return self.failure_event
+        return self.failure_event(str(error))
+
+
+
+class OpenDatabaseHandler(EngineHandler):
+    """Handles opening a database, which replaces the engine's connection"""
+
+    def handle(self, event, engine):
+        """A generator function that opens the database and yields the result event"""
+        file_extension = os.path.splitext(event.path())[-1]
+        if file_extension != '.db':
+            raise sqlite3.Error('Not a Database File')
+
+        # the new connection starts with empty caches of its own, and adds its
+        # figures to this engine's profiler
+        engine.connection, diagnostics = open_database(event.path(), engine.connection_profile)
+        set_record_cache_size(engine.record_cache_size, engine.connection)
+        engine.profiler.attach(engine.connection)
+        yield self.result_event(event.path(), diagnostics)
+
+
+
+class ProfilingHandler(EngineHandler):
+    """Handles turning the engine's profiler on or off, or checking whether it's on"""
+
+    def handle(self, event, engine):
+        """A generator function that enables or disables profiling if asked to, then
+        yields a result event reporting whether it's enabled"""
+        if isinstance(event, EnableProfilingEvent):
+            engine.profiler.enable()
+        elif isinstance(event, DisableProfilingEvent):
+            engine.profiler.disable()
+        yield self.result_event(engine.profiler.is_enabled())
+
+
+
+class ExportProfileHandler(EngineHandler):
+    """Handles writing the figures the engine's profiler has collected to a file"""
+
+    def handle(self, event, engine):
+        """A generator function that exports the profile and yields the result event"""
+        try:
+            profile = engine.profiler.export(event.profile_format())
+            with open(event.path(), 'w', encoding = 'utf-8') as profile_file:
+                profile_file.write(profile)
+        except (ValueError, OSError) as e:
+            raise sqlite3.Error(str(e)) from e
+        yield self.result_event(event.path())
@@ -8,9 +8,12 @@
 # This is the outermost layer of the part of the program that you'll need to build,
 # which means that YOU WILL DEFINITELY NEED TO MAKE CHANGES TO THIS FILE.
 
-import os
 import sqlite3
+from functools import partial
 
+from p2app.engine.event_handlers import EngineHandler, ExportProfileHandler, OpenDatabaseHandler, ProfilingHandler
+from p2app.engine.operation_control import OPERATION_TIMEOUT_SECONDS, OperationControl
+from p2app.engine.profiling import EngineProfiler
 from p2app.engine.utility_functions import *
 from p2app.events import *
 
@@ -21,62 +24,118 @@ class Engine:
     unaware of any details of how the engine is implemented.
     """
 
-    def __init__(self):
-        """Initializes the engine"""
+    def __init__(self, full_text_search: bool = False, connection_profile: dict | None = None,
+                 record_cache_size: int = RECORD_CACHE_SIZE, geography_snapshot: bool = False,
+                 operation_timeout: float | None = OPERATION_TIMEOUT_SECONDS, profiling: bool = False):
+        """Initializes the engine
+
+        full_text_search: matches searched names by ranked full-text prefix search
+        connection_profile: the PRAGMA settings applied to each database opened
+        record_cache_size: how many loaded records are cached; zero turns the cache off
+        geography_snapshot: searches and loads geography records from an in-memory snapshot
+        operation_timeout: seconds before an operation is stopped, unless its handler sets one
+        profiling: profiles events from the start, rather than from EnableProfilingEvent
+        """
         self.connection = None
-        self.event_map = {
-                            QuitInitiatedEvent: [EndApplicationEvent, ErrorEvent('End Application Failed')],
-                            OpenDatabaseEvent: [DatabaseOpenedEvent, DatabaseOpenFailedEvent],
-                            CloseDatabaseEvent: [DatabaseClosedEvent, ErrorEvent('Close Database Failed')],
-
-                            StartContinentSearchEvent: [ContinentSearchResultEvent, ErrorEvent('Corrupted Continent Search'), search_database, 'continent'],
-                            LoadContinentEvent: [ContinentLoadedEvent, ErrorEvent('Load Continent Failed'), load_record, 'continent'],
-                            SaveNewContinentEvent: [ContinentSavedEvent, SaveContinentFailedEvent, insert_record, 'continent'],
-                            SaveContinentEvent: [ContinentSavedEvent, SaveContinentFailedEvent, update_record, 'continent'],
-
-                            StartCountrySearchEvent: [CountrySearchResultEvent, ErrorEvent('Corrupted Country Search'), search_database, 'country'],
-                            LoadCountryEvent: [CountryLoadedEvent, ErrorEvent('Load Country Failed'), load_record, 'country'],
-                            SaveNewCountryEvent: [CountrySavedEvent, SaveCountryFailedEvent, insert_record, 'country'],
-                            SaveCountryEvent: [CountrySavedEvent, SaveCountryFailedEvent, update_record, 'country'],
-
-                            StartRegionSearchEvent: [RegionSearchResultEvent, ErrorEvent('Corrupted Region Search'), search_database, 'region'],
-                            LoadRegionEvent: [RegionLoadedEvent, ErrorEvent('Load Region Failed'), load_record, 'region'],
-                            SaveNewRegionEvent: [RegionSavedEvent, SaveRegionFailedEvent, insert_record, 'region'],
-                            SaveRegionEvent: [RegionSavedEvent, SaveRegionFailedEvent, update_record, 'region']
+        self.operation_timeout = operation_timeout
+        self.operation_control = OperationControl()
+        self.profiler = EngineProfiler()
+        if profiling:
+            self.profiler.enable()
+        self.record_cache_size = record_cache_size
+        self.connection_profile = DEFAULT_CONNECTION_PROFILE if connection_profile is None else connection_profile
+        search_database_records = partial(search_database, full_text=full_text_search)
+        search_database_records_page = partial(search_database_page, full_text=full_text_search)
+
+        search_geography_records = search_database_records
+        search_geography_records_page = search_database_records_page
+        load_geography_record = load_record
+        insert_geography_record = insert_record
+        update_geography_record = update_record
+        save_geography_records = save_records
+        if geography_snapshot:
+            search_geography_records = partial(search_snapshot, full_text=full_text_search)
+            search_geography_records_page = partial(search_snapshot_page, full_text=full_text_search)
+            load_geography_record = load_snapshot_record
+            insert_geography_record = partial(save_through_snapshot, save=insert_record)
+            update_geography_record = partial(save_through_snapshot, save=update_record)
+            save_geography_records = partial(save_through_snapshot, save=save_records)
+
+        self.handlers = {
+                            QuitInitiatedEvent: EngineHandler(EndApplicationEvent, ErrorEvent('End Application Failed')),
+                            OpenDatabaseEvent: OpenDatabaseHandler(DatabaseOpenedEvent, DatabaseOpenFailedEvent),
+                            CloseDatabaseEvent: EngineHandler(DatabaseClosedEvent, ErrorEvent('Close Database Failed')),
+
+                            EnableProfilingEvent: ProfilingHandler(ProfilingStateEvent, ErrorEvent('Enable Profiling Failed')),
+                            DisableProfilingEvent: ProfilingHandler(ProfilingStateEvent, ErrorEvent('Disable Profiling Failed')),
+                            CheckProfilingEvent: ProfilingHandler(ProfilingStateEvent, ErrorEvent('Check Profiling Failed')),
+                            ExportProfileEvent: ExportProfileHandler(ProfileExportedEvent, ErrorEvent('Export Profile Failed')),
+
+                            StartContinentSearchEvent: EngineHandler(ContinentSearchResultsBatchEvent, ErrorEvent('Corrupted Continent Search'), search_geography_records, 'continent'),
+                            LoadContinentEvent: EngineHandler(ContinentLoadedEvent, ErrorEvent('Load Continent Failed'), load_geography_record, 'continent'),
+                            SaveNewContinentEvent: EngineHandler(ContinentSavedEvent, SaveContinentFailedEvent, insert_geography_record, 'continent'),
+                            SaveContinentEvent: EngineHandler(ContinentSavedEvent, SaveContinentFailedEvent, update_geography_record, 'continent'),
+
+                            StartCountrySearchEvent: EngineHandler(CountrySearchResultsBatchEvent, ErrorEvent('Corrupted Country Search'), search_geography_records, 'country'),
+                            StartCountrySearchPageEvent: EngineHandler(lambda page: CountrySearchPageEvent(*page), ErrorEvent('Corrupted Country Search'), search_geography_records_page, 'country'),
+                            LoadCountryEvent: EngineHandler(CountryLoadedEvent, ErrorEvent('Load Country Failed'), load_geography_record, 'country'),
+                            SaveNewCountryEvent: EngineHandler(CountrySavedEvent, SaveCountryFailedEvent, insert_geography_record, 'country'),
+                            SaveCountryEvent: EngineHandler(CountrySavedEvent, SaveCountryFailedEvent, update_geography_record, 'country'),
+                            SaveCountriesEvent: EngineHandler(lambda batch: CountriesSavedEvent(*batch), SaveCountryFailedEvent, save_geography_records, 'country'),
+
+                            StartRegionSearchEvent: EngineHandler(RegionSearchResultsBatchEvent, ErrorEvent('Corrupted Region Search'), search_geography_records, 'region'),
+                            StartRegionSearchPageEvent: EngineHandler(lambda page: RegionSearchPageEvent(*page), ErrorEvent('Corrupted Region Search'), search_geography_records_page, 'region'),
+                            LoadRegionEvent: EngineHandler(RegionLoadedEvent, ErrorEvent('Load Region Failed'), load_geography_record, 'region'),
+                            SaveNewRegionEvent: EngineHandler(RegionSavedEvent, SaveRegionFailedEvent, insert_geography_record, 'region'),
+                            SaveRegionEvent: EngineHandler(RegionSavedEvent, SaveRegionFailedEvent, update_geography_record, 'region'),
+                            SaveRegionsEvent: EngineHandler(lambda batch: RegionsSavedEvent(*batch), SaveRegionFailedEvent, save_geography_records, 'region'),
+
+                            StartAirportSearchEvent: EngineHandler(lambda page: AirportSearchPageEvent(*page), ErrorEvent('Corrupted Airport Search'), search_database_records_page, 'airport'),
+                            LoadAirportEvent: EngineHandler(AirportLoadedEvent, ErrorEvent('Load Airport Failed'), load_record, 'airport'),
+                            LoadAirportDetailsEvent: EngineHandler(AirportDetailsLoadedEvent, ErrorEvent('Load Airport Details Failed'), load_airport_details, 'airport'),
+                            SaveNewAirportEvent: EngineHandler(AirportSavedEvent, SaveAirportFailedEvent, insert_record, 'airport'),
+                            SaveAirportEvent: EngineHandler(AirportSavedEvent, SaveAirportFailedEvent, update_record, 'airport'),
+                            StartNearestAirportsSearchEvent: EngineHandler(lambda nearby: NearbyAirportsEvent(*nearby), ErrorEvent('Corrupted Nearby Airport Search'), search_nearest, 'airport'),
+                            StartAirportsWithinRadiusSearchEvent: EngineHandler(lambda nearby: NearbyAirportsEvent(*nearby), ErrorEvent('Corrupted Nearby Airport Search'), search_within_radius, 'airport'),
+                            ComputeAirportDistancesEvent: EngineHandler(lambda distances: AirportDistancesComputedEvent(*distances), ErrorEvent('Airport Distances Failed'), compute_airport_distances, 'airport'),
+                            StartAirportBoundingBoxSearchEvent: EngineHandler(lambda airport_ids: AirportsInBoundingBoxEvent(*airport_ids), ErrorEvent('Airport Bounding Box Search Failed'), filter_airports_by_bounding_box, 'airport'),
+                            ComputeElevationHistogramsEvent: EngineHandler(lambda histograms: ElevationHistogramsComputedEvent(*histograms), ErrorEvent('Elevation Histograms Failed'), compute_elevation_histograms, 'airport'),
+
+                            StartNearestNavigationAidsSearchEvent: EngineHandler(lambda nearby: NearbyNavigationAidsEvent(*nearby), ErrorEvent('Corrupted Nearby Navigation Aid Search'), search_nearest, 'navigation_aid'),
+                            StartNavigationAidsWithinRadiusSearchEvent: EngineHandler(lambda nearby: NearbyNavigationAidsEvent(*nearby), ErrorEvent('Corrupted Nearby Navigation Aid Search'), search_within_radius, 'navigation_aid')
                         }
 
 
+    def register_handler(self, event_type: type, handler: EngineHandler):
+        """Registers the handler for a type of event, replacing any existing one"""
+        self.handlers[event_type] = handler
+
+
+    def cancel_operation(self):
+        """Cancels the operation the engine is running, if any; unlike process_event,
+        this may be called from another thread while an operation runs"""
+        self.operation_control.cancel()
+
+
     def process_event(self, event):
         """A generator function that processes one event sent from the user interface,
         yielding zero or more events in response."""
+        handler = self.handlers[type(event)]
+        timeout = self.operation_timeout if handler.timeout is None else handler.timeout
+        self.operation_control.start(self.connection, timeout)
 
+        # catches defined failures and additional ErrorEvent failures, and reports
+        # cancelled or timed out operations once the connection is usable again
         try:
-            # opens database
-            if isinstance(event, OpenDatabaseEvent):
-                file_extension = os.path.splitext(event.path())[-1]
-                if file_extension == '.db':
-                    self.connection = sqlite3.connect(event.path())
-                    self.connection.execute('PRAGMA foreign_keys = ON;')
-                    yield DatabaseOpenedEvent(event.path())
-                else:
-                    raise sqlite3.Error('Not a Database File')
-
-            # closes database or exits GUI
-            elif len(self.event_map[type(event)]) == 2:
-                yield self.event_map[type(event)][0]()
-
-            # GUI functionalities
-            else:
-                geo_scope = self.event_map[type(event)][3]
-                result = self.event_map[type(event)][2](event, geo_scope, self.connection)
-                if isinstance(result, str):
-                    raise sqlite3.Error(result)
-                for record in result:
-                    yield self.event_map[type(event)][0](record)
-
-        # catches defined failures and additional ErrorEvent failures
+            yield from self.profiler.profile(type(event).__name__, handler.geo_scope, handler.handle(event, self))
         except sqlite3.Error as e:
-            if isinstance(self.event_map[type(event)][1], ErrorEvent):
-                yield self.event_map[type(event)][1]
+            stop_reason = self.operation_control.stop_reason()
+            if stop_reason is None:
+                yield handler.failure(e)
             else:
-                yield self.event_map[type(event)][1](str(e))
\ No newline at end of file
+                if self.connection is not None and self.connection.in_transaction:
+                    self.connection.rollback()
+                yield OperationCancelledEvent(
+                    type(event).__name__, stop_reason, self.operation_control.elapsed_seconds())
+        finally:
+            self.operation_control.finish()
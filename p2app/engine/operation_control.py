@@ -0,0 +1,92 @@
+# p2app/engine/operation_control.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Tracks the operation the engine is running, so that it can be stopped, either
+# because the user interface cancelled it or because its deadline passed.
+#
+# While an operation runs, SQLite calls a progress handler every few thousand
+# instructions, which stops the running statement once the operation has been
+# cancelled or has timed out; cancelling also interrupts the connection, so a
+# statement is stopped at once even from another thread.
+
+import sqlite3
+import threading
+import time
+
+OPERATION_TIMEOUT_SECONDS = 30.0
+PROGRESS_HANDLER_INSTRUCTIONS = 10000
+
+CANCELLED = 'Cancelled'
+TIMED_OUT = 'Timed Out'
+
+
+
+class OperationControl:
+    """Tracks the deadline and cancellation of the engine's running operation"""
+
+    def __init__(self):
+        """Initializes the control with no operation running"""
+        self._cancel_requested = threading.Event()
+        self._connection = None
+        self._started = None
+        self._deadline = None
+        self._stop_reason = None
+
+
+    def start(self, connection, timeout: float | None):
+        """Starts tracking an operation on a connection, which is stopped once timeout
+        seconds have passed (or never, if timeout is None)"""
+        self._cancel_requested.clear()
+        self._stop_reason = None
+        self._started = time.monotonic()
+        self._deadline = None if timeout is None else self._started + timeout
+        self._connection = connection
+
+        if connection is not None:
+            connection.set_progress_handler(self._check_progress, PROGRESS_HANDLER_INSTRUCTIONS)
+
+
+    def finish(self):
+        """Stops tracking the operation"""
+        connection = self._connection
+        self._connection = None
+
+        if connection is not None:
+            try:
+                connection.set_progress_handler(None, 0)
+            except sqlite3.ProgrammingError:
+                # the operation closed its connection
+                pass
+
+
+    def cancel(self):
+        """Cancels the running operation; this may be called from any thread"""
+        self._cancel_requested.set()
+
+        connection = self._connection
+        if connection is not None:
+            connection.interrupt()
+
+
+    def stop_reason(self) -> str | None:
+        """Gets why the operation was stopped, or None if it wasn't"""
+        if self._stop_reason is None and self._cancel_requested.is_set():
+            return CANCELLED
+        return self._stop_reason
+
+
+    def elapsed_seconds(self) -> float:
+        """Gets how long the operation has been running"""
+        return time.monotonic() - self._started
+
+
+    def _check_progress(self) -> int:
+        if self._cancel_requested.is_set():
+            self._stop_reason = CANCELLED
+            return 1
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            self._stop_reason = TIMED_OUT
+            return 1
+        return 0
@@ -0,0 +1,194 @@
+# p2app/engine/profiling.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Records how long the engine spends on each type of event, per table, so that
+# operations that slow down under load can be found.
+#
+# For each (event type, geo_scope) pair, the profiler keeps the number of events
+# processed, the wall time spent producing their results, the part of it spent
+# running SQL, the rows SQLite returned and the rows converted to namedtuples,
+# along with a histogram of each event's wall time.  Wall time only counts the
+# time the engine spends producing results, not the time the user interface
+# spends handling them between results.  The figures can be exported as JSON or
+# in the Prometheus text exposition format.
+
+import json
+import time
+from bisect import bisect_left
+
+from p2app.engine.utility_functions import attach_sql_profile
+from p2app.engine.utility_functions import new_sql_profile
+
+LATENCY_BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+JSON_FORMAT = 'json'
+PROMETHEUS_FORMAT = 'prometheus'
+PROFILE_FORMATS = (JSON_FORMAT, PROMETHEUS_FORMAT)
+
+_METRIC_PREFIX = 'p2app_engine'
+
+
+
+class EngineProfiler:
+    """Collects per-event timings and row counts while profiling is enabled"""
+
+    def __init__(self):
+        """Initializes the profiler, which starts out disabled and empty"""
+        self._sql_profile = new_sql_profile()
+        self._stats = dict()
+
+
+    def attach(self, connection):
+        """Makes a connection add the SQL it runs and the rows it returns and converts
+        to this profiler's figures, rather than to any other engine's"""
+        attach_sql_profile(self._sql_profile, connection)
+
+
+    def is_enabled(self) -> bool:
+        """Checks whether events are being profiled"""
+        return self._sql_profile['enabled']
+
+
+    def enable(self):
+        """Starts profiling events, keeping any figures already collected"""
+        self._sql_profile['enabled'] = True
+
+
+    def disable(self):
+        """Stops profiling events, keeping the figures collected so far"""
+        self._sql_profile['enabled'] = False
+
+
+    def reset(self):
+        """Discards every figure collected so far"""
+        self._stats = dict()
+
+
+    def profile(self, event_type: str, geo_scope: str | None, results):
+        """A generator function that yields the results of one event, recording the
+        time spent producing them once they're exhausted, closed or have failed,
+        unless profiling was disabled in the meantime"""
+        if not self.is_enabled():
+            yield from results
+            return
+
+        started_profile = dict(self._sql_profile)
+        wall_seconds = 0.0
+
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    result = next(results)
+                except StopIteration:
+                    return
+                finally:
+                    wall_seconds += time.perf_counter() - started
+
+                yield result
+        finally:
+            results.close()
+
+            if self.is_enabled():
+                self.record(
+                    event_type, geo_scope, wall_seconds,
+                    self._sql_profile['sql_seconds'] - started_profile['sql_seconds'],
+                    self._sql_profile['rows_returned'] - started_profile['rows_returned'],
+                    self._sql_profile['rows_converted'] - started_profile['rows_converted'])
+
+
+    def record(self, event_type: str, geo_scope: str | None, wall_seconds: float,
+               sql_seconds: float, rows_returned: int, rows_converted: int):
+        """Adds the figures for one processed event"""
+        stats = self._stats.get((event_type, geo_scope))
+        if stats is None:
+            stats = {'count': 0, 'wall_seconds': 0.0, 'max_wall_seconds': 0.0, 'sql_seconds': 0.0,
+                     'rows_returned': 0, 'rows_converted': 0,
+                     'buckets': [0] * (len(LATENCY_BUCKETS_SECONDS) + 1)}
+            self._stats[(event_type, geo_scope)] = stats
+
+        stats['count'] += 1
+        stats['wall_seconds'] += wall_seconds
+        stats['max_wall_seconds'] = max(stats['max_wall_seconds'], wall_seconds)
+        stats['sql_seconds'] += sql_seconds
+        stats['rows_returned'] += rows_returned
+        stats['rows_converted'] += rows_converted
+        stats['buckets'][bisect_left(LATENCY_BUCKETS_SECONDS, wall_seconds)] += 1
+
+
+    def report(self) -> list:
+        """Gets the figures for each (event type, geo_scope) pair, with cumulative
+        histogram buckets keyed by their upper bounds in seconds"""
+        report = list()
+        for (event_type, geo_scope), stats in sorted(self._stats.items(), key=_report_order):
+            cumulative_counts = list()
+            total = 0
+            for bucket_count in stats['buckets']:
+                total += bucket_count
+                cumulative_counts.append(total)
+
+            report.append({'event_type': event_type,
+                           'geo_scope': geo_scope,
+                           'count': stats['count'],
+                           'wall_seconds': stats['wall_seconds'],
+                           'mean_wall_seconds': stats['wall_seconds'] / stats['count'],
+                           'max_wall_seconds': stats['max_wall_seconds'],
+                           'sql_seconds': stats['sql_seconds'],
+                           'rows_returned': stats['rows_returned'],
+                           'rows_converted': stats['rows_converted'],
+                           'latency_buckets': [{'le': le, 'count': count} for le, count in
+                                               zip(LATENCY_BUCKETS_SECONDS + ('+Inf',), cumulative_counts)]})
+        return report
+
+
+    def export(self, profile_format: str) -> str:
+        """Exports the figures in one of the PROFILE_FORMATS"""
+        if profile_format == JSON_FORMAT:
+            return self.to_json()
+        elif profile_format == PROMETHEUS_FORMAT:
+            return self.to_prometheus()
+        raise ValueError(f'Unknown profile format: {profile_format}')
+
+
+    def to_json(self) -> str:
+        """Exports the figures as a JSON array with one object per (event type, geo_scope)"""
+        return json.dumps(self.report(), indent = 2)
+
+
+    def to_prometheus(self) -> str:
+        """Exports the figures in the Prometheus text exposition format"""
+        report = self.report()
+        lines = list()
+
+        lines.append(f'# HELP {_METRIC_PREFIX}_event_duration_seconds Wall time spent producing the results of an event.')
+        lines.append(f'# TYPE {_METRIC_PREFIX}_event_duration_seconds histogram')
+        for entry in report:
+            labels = _prometheus_labels(entry)
+            for bucket in entry['latency_buckets']:
+                lines.append(f'{_METRIC_PREFIX}_event_duration_seconds_bucket'
+                             f'{{{labels},le="{bucket["le"]}"}} {bucket["count"]}')
+            lines.append(f'{_METRIC_PREFIX}_event_duration_seconds_sum{{{labels}}} {entry["wall_seconds"]!r}')
+            lines.append(f'{_METRIC_PREFIX}_event_duration_seconds_count{{{labels}}} {entry["count"]}')
+
+        counters = (('sql_seconds', 'Time spent running SQL statements for an event.'),
+                    ('rows_returned', 'Rows returned by SQLite for an event.'),
+                    ('rows_converted', 'Rows converted to records for an event.'))
+        for figure, description in counters:
+            lines.append(f'# HELP {_METRIC_PREFIX}_{figure}_total {description}')
+            lines.append(f'# TYPE {_METRIC_PREFIX}_{figure}_total counter')
+            for entry in report:
+                lines.append(f'{_METRIC_PREFIX}_{figure}_total{{{_prometheus_labels(entry)}}} {entry[figure]!r}')
+
+        return '\n'.join(lines) + '\n'
+
+
+
+def _report_order(item) -> tuple:
+    (event_type, geo_scope), _ = item
+    return event_type, geo_scope or ''
+
+
+def _prometheus_labels(entry: dict) -> str:
+    return f'event="{entry["event_type"]}",geo_scope="{entry["geo_scope"] or ""}"'
@@ -5,7 +5,32 @@
 #
 # Initialization module for the p2app.engine.utility_functions package.
 
+from p2app.engine.utility_functions.database_utils import DEFAULT_CONNECTION_PROFILE
+from p2app.engine.utility_functions.database_utils import open_database
+from p2app.engine.utility_functions.search_cache import search_cache_info
 from p2app.engine.utility_functions.event_search import search_database
+from p2app.engine.utility_functions.event_search import search_database_page
 from p2app.engine.utility_functions.event_load import load_record
+from p2app.engine.utility_functions.event_load import load_airport_details
+from p2app.engine.utility_functions.record_cache import RECORD_CACHE_SIZE
+from p2app.engine.utility_functions.record_cache import record_cache_info
+from p2app.engine.utility_functions.record_cache import set_record_cache_size
 from p2app.engine.utility_functions.event_save import insert_record
-from p2app.engine.utility_functions.event_save import update_record
\ No newline at end of file
+from p2app.engine.utility_functions.event_save import update_record
+from p2app.engine.utility_functions.event_save import save_records
+from p2app.engine.utility_functions.geography_snapshot import load_snapshot_record
+from p2app.engine.utility_functions.geography_snapshot import save_through_snapshot
+from p2app.engine.utility_functions.geography_snapshot import search_snapshot
+from p2app.engine.utility_functions.geography_snapshot import search_snapshot_page
+from p2app.engine.utility_functions.spatial_search import search_nearest
+from p2app.engine.utility_functions.spatial_search import search_within_radius
+from p2app.engine.utility_functions.sql_profiling import attach_sql_profile
+from p2app.engine.utility_functions.sql_profiling import new_sql_profile
+from p2app.engine.utility_functions.sql_statements import STATEMENT_CACHE_SIZE
+from p2app.engine.utility_functions.sql_statements import precompile_statements
+from p2app.engine.utility_functions.sql_statements import statement_cache_info
+from p2app.engine.utility_functions.full_text import FULL_TEXT_AVAILABLE
+from p2app.engine.utility_functions.airport_columns import NUMPY_AVAILABLE
+from p2app.engine.utility_functions.airport_columns import compute_airport_distances
+from p2app.engine.utility_functions.airport_columns import filter_airports_by_bounding_box
+from p2app.engine.utility_functions.airport_columns import compute_elevation_histograms
@@ -0,0 +1,147 @@
+# p2app/engine/utility_functions/airport_columns.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Utility functions for vectorized computations over every airport at once
+# Airport coordinates, elevations and runway endpoints are loaded into NumPy
+# arrays, which are reloaded once saves have changed the airport table
+#
+# NumPy is optional; without it, these computations report a failure
+
+from collections import namedtuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from p2app.engine.utility_functions.connection_state import get_connection_state
+from p2app.engine.utility_functions.event_save import table_generation
+from p2app.engine.utility_functions.spatial_search import EARTH_RADIUS_KM
+
+NUMPY_AVAILABLE = numpy is not None
+
+AirportColumns = namedtuple(
+    'AirportColumns',
+    ['airport_id', 'latitude_deg', 'longitude_deg', 'elevation_ft', 'country_id', 'region_id',
+     'runway_airport_id', 'le_latitude_deg', 'le_longitude_deg', 'he_latitude_deg', 'he_longitude_deg'])
+
+def compute_airport_distances(event, geo_scope: str, connection) -> list | str:
+    """Computes the distance (in kilometers) between every pair of origin and
+    destination airports"""
+    if not NUMPY_AVAILABLE:
+        return 'NumPy Not Installed'
+    columns = get_airport_columns(connection)
+    origin_indexes = get_airport_indexes(columns, event.origin_airport_ids())
+    destination_indexes = get_airport_indexes(columns, event.destination_airport_ids())
+    if origin_indexes is None or destination_indexes is None:
+        return 'Unknown Airport'
+
+    distances_km = haversine_distances(columns.latitude_deg[origin_indexes, numpy.newaxis],
+                                       columns.longitude_deg[origin_indexes, numpy.newaxis],
+                                       columns.latitude_deg[destination_indexes],
+                                       columns.longitude_deg[destination_indexes])
+    distances_km = tuple([tuple(row) for row in distances_km.tolist()])
+    return [(tuple(event.origin_airport_ids()), tuple(event.destination_airport_ids()), distances_km)]
+
+
+def filter_airports_by_bounding_box(event, geo_scope: str, connection) -> list | str:
+    """Finds the airports whose own position or any of whose runway ends lie inside a
+    bounding box, which wraps around the antimeridian when min_longitude_deg is
+    greater than max_longitude_deg"""
+    if not NUMPY_AVAILABLE:
+        return 'NumPy Not Installed'
+    columns = get_airport_columns(connection)
+    bounding_box = (event.min_latitude_deg(), event.max_latitude_deg(),
+                    event.min_longitude_deg(), event.max_longitude_deg())
+
+    inside = in_bounding_box(columns.latitude_deg, columns.longitude_deg, *bounding_box)
+    runway_inside = in_bounding_box(columns.le_latitude_deg, columns.le_longitude_deg, *bounding_box) | \
+                    in_bounding_box(columns.he_latitude_deg, columns.he_longitude_deg, *bounding_box)
+    airport_ids = numpy.union1d(columns.airport_id[inside], columns.runway_airport_id[runway_inside])
+    return [(tuple(airport_ids.tolist()),)]
+
+
+def compute_elevation_histograms(event, geo_scope: str, connection) -> list | str:
+    """Counts the airports of every region whose elevation falls in each bin, leaving out
+    airports without an elevation or outside every bin"""
+    if not NUMPY_AVAILABLE:
+        return 'NumPy Not Installed'
+    columns = get_airport_columns(connection)
+    bin_edges_ft = numpy.asarray(event.bin_edges_ft(), dtype=float)
+    if bin_edges_ft.size < 2 or numpy.any(numpy.diff(bin_edges_ft) <= 0):
+        return 'Invalid Elevation Bins'
+
+    bin_count = bin_edges_ft.size - 1
+    binned = ~numpy.isnan(columns.elevation_ft) & (columns.elevation_ft >= bin_edges_ft[0]) & \
+             (columns.elevation_ft <= bin_edges_ft[-1])
+    bin_indexes = numpy.searchsorted(bin_edges_ft, columns.elevation_ft[binned], side='right') - 1
+    bin_indexes = numpy.minimum(bin_indexes, bin_count - 1)
+    region_ids, region_indexes = numpy.unique(columns.region_id[binned], return_inverse=True)
+
+    counts = numpy.bincount(region_indexes * bin_count + bin_indexes, minlength=region_ids.size * bin_count)
+    counts = counts.reshape(region_ids.size, bin_count)
+    histograms = {region_id: tuple(row) for region_id, row in zip(region_ids.tolist(), counts.tolist())}
+    return [(tuple(bin_edges_ft.tolist()), histograms)]
+
+
+def get_airport_columns(connection) -> AirportColumns:
+    """Gets the airport columns for a connection, reloading them if saves have changed
+    the airport table since they were loaded"""
+    loaded_columns = get_connection_state(connection, 'airport_columns',
+                                          lambda: {'generation': None, 'columns': None})
+    generation = table_generation('airport', connection)
+    if loaded_columns['generation'] != generation:
+        loaded_columns['columns'] = load_airport_columns(connection)
+        loaded_columns['generation'] = generation
+    return loaded_columns['columns']
+
+
+def load_airport_columns(connection) -> AirportColumns:
+    """Loads airport positions and runway ends into arrays ordered by airport id, with
+    missing values stored as NaN"""
+    cursor = connection.execute('''SELECT airport_id, latitude_deg, longitude_deg, elevation_ft, country_id, region_id
+                                   FROM airport ORDER BY airport_id;''')
+    airports = numpy.array(cursor.fetchall(), dtype=float).reshape(-1, 6)
+    cursor.close()
+
+    cursor = connection.execute('''SELECT airport_id, le_latitude_deg, le_longitude_deg, he_latitude_deg, he_longitude_deg
+                                   FROM runway;''')
+    runways = numpy.array(cursor.fetchall(), dtype=float).reshape(-1, 5)
+    cursor.close()
+
+    return AirportColumns(airports[:, 0].astype(numpy.int64), airports[:, 1], airports[:, 2], airports[:, 3],
+                          airports[:, 4].astype(numpy.int64), airports[:, 5].astype(numpy.int64),
+                          runways[:, 0].astype(numpy.int64), runways[:, 1], runways[:, 2], runways[:, 3],
+                          runways[:, 4])
+
+
+def get_airport_indexes(columns: AirportColumns, airport_ids) -> 'numpy.ndarray | None':
+    """Gets the array positions of airports, or None if any of them doesn't exist"""
+    airport_ids = numpy.asarray(airport_ids, dtype=numpy.int64)
+    indexes = numpy.searchsorted(columns.airport_id, airport_ids)
+    if numpy.any(indexes >= columns.airport_id.size):
+        return None
+    if numpy.any(columns.airport_id[indexes] != airport_ids):
+        return None
+    return indexes
+
+
+def haversine_distances(latitude1, longitude1, latitude2, longitude2) -> 'numpy.ndarray':
+    """Gets the great-circle distances between arrays of points in kilometers,
+    broadcasting them against each other"""
+    phi1, phi2 = numpy.radians(latitude1), numpy.radians(latitude2)
+    delta_phi = phi2 - phi1
+    delta_lambda = numpy.radians(longitude2 - longitude1)
+    a = numpy.sin(delta_phi / 2) ** 2 + numpy.cos(phi1) * numpy.cos(phi2) * numpy.sin(delta_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * numpy.arcsin(numpy.minimum(1.0, numpy.sqrt(a)))
+
+
+def in_bounding_box(latitude, longitude, min_latitude: float, max_latitude: float,
+                    min_longitude: float, max_longitude: float) -> 'numpy.ndarray':
+    """Checks which points lie inside a bounding box; NaN coordinates never do"""
+    inside_latitude = (latitude >= min_latitude) & (latitude <= max_latitude)
+    if min_longitude <= max_longitude:
+        return inside_latitude & (longitude >= min_longitude) & (longitude <= max_longitude)
+    return inside_latitude & ((longitude >= min_longitude) | (longitude <= max_longitude))
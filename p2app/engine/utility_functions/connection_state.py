@@ -0,0 +1,26 @@
+# p2app/engine/utility_functions/connection_state.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# State the engine keeps for each database connection, such as its caches and the
+# generations of its tables
+# The state is stored on the connection itself, so two engines never share
+# caches, and opening another database starts over with empty ones
+
+ENGINE_STATE_ATTRIBUTE = 'engine_state'
+
+
+def get_connection_state(connection, name: str, create):
+    """Gets one piece of a connection's state, calling create to build it on first use;
+    the connection must be one opened by open_database"""
+    state = getattr(connection, ENGINE_STATE_ATTRIBUTE, None)
+    if state is None:
+        state = dict()
+        setattr(connection, ENGINE_STATE_ATTRIBUTE, state)
+
+    value = state.get(name)
+    if value is None:
+        value = create()
+        state[name] = value
+    return value
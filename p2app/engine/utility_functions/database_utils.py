@@ -0,0 +1,64 @@
+# p2app/engine/utility_functions/database_utils.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Utility functions for opening database connections
+# Applies a configurable profile of PRAGMA settings to each new connection
+
+import sqlite3
+from pathlib import Path
+
+from p2app.engine.utility_functions.schema_migrations import migrate_schema
+from p2app.engine.utility_functions.sql_profiling import ProfiledConnection
+from p2app.engine.utility_functions.sql_statements import STATEMENT_CACHE_SIZE
+
+DEFAULT_CONNECTION_PROFILE = {'journal_mode': 'WAL',
+                              'synchronous': 'NORMAL',
+                              'cache_size': -32000,
+                              'mmap_size': 268435456,
+                              'temp_store': 'MEMORY',
+                              'busy_timeout': 5000,
+                              'foreign_keys': 'ON'}
+
+
+def open_database(path: Path, profile: dict) -> tuple:
+    """Opens a connection to the database, applies the PRAGMA profile to it and
+    migrates its schema, returning the connection along with the settings SQLite
+    actually applied"""
+    connection = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE, factory=ProfiledConnection)
+    try:
+        diagnostics = apply_connection_profile(profile, connection)
+        diagnostics['schema_migration'] = migrate_schema(connection)
+    except sqlite3.Error:
+        connection.close()
+        raise
+    return connection, diagnostics
+
+
+def apply_connection_profile(profile: dict, connection) -> dict:
+    """Sets each PRAGMA in the profile, then reads it back, since SQLite may keep a
+    different value (e.g., journal_mode on an in-memory database)
+    A PRAGMA that can't be set (e.g., journal_mode = WAL on a read-only database) is
+    skipped, reporting the value still in effect, or why it was skipped if that can't
+    be read either; only a file that is not a database makes the profile fail"""
+    diagnostics = dict()
+    for pragma, value in profile.items():
+        failure = None
+        try:
+            connection.execute(f'PRAGMA {pragma} = {value};').close()
+        except sqlite3.OperationalError as e:
+            failure = f'skipped: {e}'
+        diagnostics[pragma] = read_pragma(pragma, connection, failure)
+    return diagnostics
+
+
+def read_pragma(pragma: str, connection, failure: str | None = None):
+    """Reads the value of a PRAGMA in effect, giving back failure if it can't be read"""
+    try:
+        cursor = connection.execute(f'PRAGMA {pragma};')
+    except sqlite3.OperationalError:
+        return failure
+    applied_value = cursor.fetchone()
+    cursor.close()
+    return applied_value[0] if applied_value is not None else None
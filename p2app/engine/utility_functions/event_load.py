@@ -6,11 +6,24 @@
 # Utility functions for loading-type events
 
 from p2app.engine.utility_functions.event_utils import convert_namedtuple
+from p2app.engine.utility_functions.record_cache import cache_record, get_cached_record
+from p2app.engine.utility_functions.sql_statements import get_statement
+from p2app.events.airports import AirportDetails
 
-def load_record(event, geo_scope: str, connection) -> tuple:
-    """Loads record corresponding to the id given by the user"""
+LOAD_BATCH_SIZE = 256
+
+def load_record(event, geo_scope: str, connection) -> list | str:
+    """Loads record corresponding to the id given by the user, from the record cache
+    when it holds the record"""
     record_id = get_record_id(event, geo_scope)
+    cached_record = get_cached_record(geo_scope, record_id, connection)
+    if cached_record is not None:
+        return [cached_record]
+
     matching_record = get_matching_record(record_id, geo_scope, connection)
+    if isinstance(matching_record, str):
+        return matching_record
+    cache_record(geo_scope, record_id, matching_record[0], connection)
     return matching_record
 
 
@@ -22,13 +35,51 @@ def get_record_id(event, geo_scope: str) -> int:
         return event.country_id()
     elif geo_scope == 'region':
         return event.region_id()
+    elif geo_scope == 'airport':
+        return event.airport_id()
 
 
-def get_matching_record(record_id: int, geo_scope: str, connection) -> tuple:
+def get_matching_record(record_id: int, geo_scope: str, connection) -> list | str:
     """Gets record with a matching id"""
-    cursor = connection.execute(f'''SELECT * 
-                                    FROM {geo_scope} 
-                                    WHERE {geo_scope}_id = {record_id};''')
-    matching_record = convert_namedtuple(cursor.fetchone(), geo_scope)
+    cursor = connection.execute(get_statement('load', geo_scope), (record_id,))
+    row = cursor.fetchone()
+    cursor.close()
+    if row is None:
+        return 'Record Not Found'
+    return convert_namedtuple(row, geo_scope, connection)
+
+def load_airport_details(event, geo_scope: str, connection) -> list:
+    """Loads airports along with their runways and frequencies, using one query per
+    table for each batch of requested ids, and leaving out ids with no airport"""
+    airport_ids = list(dict.fromkeys(event.airport_ids()))
+    airports = dict()
+    runways = dict()
+    frequencies = dict()
+
+    for start in range(0, len(airport_ids), LOAD_BATCH_SIZE):
+        batch_ids = airport_ids[start:start + LOAD_BATCH_SIZE]
+        for airport in get_records_by_column(batch_ids, geo_scope, 'airport_id', connection):
+            airports[airport.airport_id] = airport
+        for runway in get_records_by_column(batch_ids, 'runway', 'airport_id', connection):
+            runways.setdefault(runway.airport_id, list()).append(runway)
+        for frequency in get_records_by_column(batch_ids, 'airport_frequency', 'airport_id', connection):
+            frequencies.setdefault(frequency.airport_id, list()).append(frequency)
+
+    airport_details = [AirportDetails(airports[airport_id],
+                                      tuple(runways.get(airport_id, ())),
+                                      tuple(frequencies.get(airport_id, ())))
+                       for airport_id in airport_ids if airport_id in airports]
+    return [tuple(airport_details)]
+
+
+def get_records_by_column(values: list, geo_scope: str, column: str, connection) -> list:
+    """Gets the records whose column matches any of the values in one query, padding
+    the values to a power of two so that only a few distinct statements are built"""
+    if not values:
+        return []
+    placeholder_count = 1 << (len(values) - 1).bit_length()
+    padded_values = values + [values[-1]] * (placeholder_count - len(values))
+    cursor = connection.execute(get_statement('load_many', geo_scope, (column, placeholder_count)), padded_values)
+    matching_records = convert_namedtuple(cursor.fetchall(), geo_scope, connection)
     cursor.close()
-    return matching_record
\ No newline at end of file
+    return matching_records
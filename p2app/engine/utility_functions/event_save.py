@@ -7,7 +7,12 @@
 # Mostly specific to either inserting or updating
 # Includes some important functions that cover both
 
+import sqlite3
+
+from p2app.engine.utility_functions.connection_state import get_connection_state
+from p2app.engine.utility_functions.record_cache import invalidate_record
 from p2app.engine.utility_functions.save_utils import *
+from p2app.engine.utility_functions.sql_statements import get_statement
 
 def insert_record(event, geo_scope: str, connection) -> str | tuple:
     """Inserts a new record in the database"""
@@ -28,46 +33,123 @@ def save_record(event, mode: str, geo_scope: str, connection) -> str | tuple:
         return error_message
 
     if mode == 'insert':
-        generate_new_id(record, geo_scope, connection)
-    record_tuple = handle_empty_widget_entries(record, geo_scope)
+        record[0] = None
+    handle_empty_widget_entries(record, geo_scope)
     modify_table(mode, record, geo_scope, connection)
-    return record_tuple
-
-
-def generate_new_id(record: list, geo_scope: str, connection):
-    """Generates a valid id for inserting a new record"""
-    cursor = connection.execute(f'''SELECT {geo_scope}_id 
-                                    FROM {geo_scope} 
-                                    ORDER BY {geo_scope}_id DESC;''')
-    recent_record = cursor.fetchone()
-    if recent_record is not None:
-        record[0] = recent_record[0] + 1
-    else:
-        record[0] = 1
+    invalidate_record(geo_scope, record[0], connection)
+    return convert_namedtuple(tuple(record), geo_scope, connection)
+
+
+def save_records(event, geo_scope: str, connection) -> list:
+    """Saves a batch of records in one transaction, inserting those without an id and
+    updating the rest, and collects a failure reason for every record left unsaved"""
+    saved_records = {'insert': list(), 'update': list()}
+    failed_records = list()
+    batch_codes = set()
+
+    for record in get_records(event, geo_scope):
+        error_message = invalid_widget_entries(record, geo_scope, connection) or ''
+        if record[1] in batch_codes:
+            error_message += code_taken_message(geo_scope)
+        if error_message:
+            failed_records.append((convert_namedtuple(tuple(record), geo_scope, connection)[0], error_message))
+            continue
+        batch_codes.add(record[1])
+
+        mode = 'insert' if record[0] is None else 'update'
+        handle_empty_widget_entries(record, geo_scope)
+        saved_records[mode].append(record)
+
+    failed_records += modify_table_batch(saved_records, geo_scope, connection)
+    for record in saved_records['update']:
+        invalidate_record(geo_scope, record[0], connection)
+    saved_tuples = [convert_namedtuple(tuple(record), geo_scope, connection)[0]
+                    for mode in saved_records for record in saved_records[mode]]
+    return [(tuple(saved_tuples), tuple(failed_records))]
+
+
+def assign_new_ids(records: list, geo_scope: str, connection):
+    """Assigns the ids SQLite gave to a batch of just-inserted records, which are
+    consecutive because the open write transaction keeps other writers out"""
+    cursor = connection.execute(get_statement('max_id', geo_scope))
+    last_id = cursor.fetchone()[0]
     cursor.close()
+    for offset, record in enumerate(records):
+        record[0] = last_id - len(records) + 1 + offset
 
 
 def modify_table(mode: str, record: list, geo_scope: str, connection):
-    """Updates an existing record in the specified table"""
-    parameters = {'continent': ['continent_id', 'continent_code', 'name'],
-                  'country': ['country_id', 'country_code', 'name', 'continent_id', 'wikipedia_link', 'keywords'],
-                  'region': ['region_id', 'region_code', 'local_code', 'name', 'continent_id', 'country_id', 'wikipedia_link', 'keywords']}
-
+    """Updates an existing record in the specified table, letting SQLite assign the id
+    of an inserted record"""
+    cursor = connection.execute(get_statement(mode, geo_scope), get_statement_values(mode, record))
     if mode == 'insert':
-        connection.execute(f'''INSERT INTO {geo_scope} ({', '.join(parameters[geo_scope])})
-                               VALUES ({', '.join(['?' for _ in record])});''', record)
-    elif mode == 'update':
-        set_statement = generate_set_statement(record, parameters[geo_scope])
-        record_values = record[1:] + [record[0]]
-        connection.execute(f'''UPDATE {geo_scope}
-                               {set_statement}
-                               WHERE {geo_scope}_id = ?;''', record_values)
+        record[0] = cursor.lastrowid
+    cursor.close()
     connection.commit()
+    advance_table_generation(geo_scope, connection)
+
+
+def modify_table_batch(records: dict, geo_scope: str, connection) -> list:
+    """Writes batches of inserted and updated records in a single transaction, falling
+    back to one statement per record if the batch violates a constraint, so that one
+    bad record does not undo the others"""
+    try:
+        for mode in records:
+            connection.executemany(get_statement(mode, geo_scope),
+                                   [get_statement_values(mode, record) for record in records[mode]])
+            if mode == 'insert' and records[mode]:
+                assign_new_ids(records[mode], geo_scope, connection)
+    except sqlite3.IntegrityError:
+        connection.rollback()
+        for record in records['insert']:
+            record[0] = None
+        return modify_table_each(records, geo_scope, connection)
+    except sqlite3.Error:
+        # any other failure (e.g., a locked database) must not leave the batch
+        # pending, or the next commit would save the records reported as failed
+        connection.rollback()
+        raise
+    connection.commit()
+    advance_table_generation(geo_scope, connection)
+    return []
+
+
+def modify_table_each(records: dict, geo_scope: str, connection) -> list:
+    """Writes records one statement at a time inside a single transaction, removing and
+    reporting the records that fail"""
+    failed_records = list()
+    for mode in records:
+        for record in list(records[mode]):
+            try:
+                cursor = connection.execute(get_statement(mode, geo_scope), get_statement_values(mode, record))
+                if mode == 'insert':
+                    record[0] = cursor.lastrowid
+                cursor.close()
+            except sqlite3.IntegrityError as e:
+                records[mode].remove(record)
+                failed_records.append((convert_namedtuple(tuple(record), geo_scope, connection)[0], str(e)))
+            except sqlite3.Error:
+                connection.rollback()
+                raise
+    connection.commit()
+    advance_table_generation(geo_scope, connection)
+    return failed_records
+
+
+def table_generation(geo_scope: str, connection) -> int:
+    """Gets a counter that changes every time records are saved to a table through a
+    connection, so that anything derived from the table can tell when it is out of date"""
+    return get_connection_state(connection, 'table_generations', dict).get(geo_scope, 0)
+
+
+def advance_table_generation(geo_scope: str, connection):
+    """Marks everything derived from a table as out of date"""
+    table_generations = get_connection_state(connection, 'table_generations', dict)
+    table_generations[geo_scope] = table_generations.get(geo_scope, 0) + 1
 
 
-def generate_set_statement(record: list, parameters: list) -> str:
-    """Generates a SQL SET statement for updating an existing record"""
-    set_statement = 'SET'
-    for i in range(1, len(record)):
-        set_statement += f' {parameters[i]} = ?,'
-    return set_statement[:-1]
\ No newline at end of file
+def get_statement_values(mode: str, record: list) -> list:
+    """Orders a record's values to match the parameters of its SQL statement"""
+    if mode == 'update':
+        return record[1:] + [record[0]]
+    return record
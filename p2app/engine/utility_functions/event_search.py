@@ -5,14 +5,85 @@
 #
 # Utility functions for searching-type events
 
+from collections.abc import Iterator
+
 from p2app.engine.utility_functions.event_utils import convert_namedtuple
+from p2app.engine.utility_functions.full_text import apply_full_text_search
+from p2app.engine.utility_functions.search_cache import SEARCH_CACHE_ROWS, cache_results, get_cached_results
+from p2app.engine.utility_functions.sql_statements import FULL_TEXT_FILTER, get_statement
+
+SEARCH_BATCH_SIZE = 256
+FIRST_PAGE_TOKEN = -2 ** 63
+FIRST_RANKED_PAGE_TOKEN = (float('-inf'), FIRST_PAGE_TOKEN)
+
+def search_database(event, geo_scope: str, connection, full_text: bool = False) -> Iterator[tuple]:
+    """Searches database for record matching user-inputted constraints, yielding them
+    in batches, from the search cache when it holds an up-to-date result"""
+    widget_entries = get_widget_entries(event, geo_scope)
+    cache_key = (geo_scope, 'search', full_text) + get_search_filter(widget_entries)
+    cached_records = get_cached_results(cache_key, connection)
+    if cached_records is not None:
+        for start in range(0, len(cached_records), SEARCH_BATCH_SIZE):
+            yield cached_records[start:start + SEARCH_BATCH_SIZE]
+        return
 
-def search_database(event, geo_scope: str, connection) -> list:
-    """Searches database for record matching user-inputted constraints"""
+    if full_text:
+        widget_entries = apply_full_text_search(widget_entries, geo_scope, connection)
+    filter_shape, entry_values = get_search_filter(widget_entries)
+    statement = get_statement('search', geo_scope, filter_shape)
+
+    # results too large for the search cache stop being collected
+    matching_records = list()
+    for batch in get_matching_records(statement, entry_values, geo_scope, connection):
+        if matching_records is not None:
+            matching_records.extend(batch)
+            if len(matching_records) > SEARCH_CACHE_ROWS:
+                matching_records = None
+        yield batch
+    if matching_records is not None:
+        cache_results(cache_key, tuple(matching_records), len(matching_records), connection)
+
+
+def search_database_page(event, geo_scope: str, connection, full_text: bool = False) -> list:
+    """Searches database for one page of matching records, from the search cache when
+    it holds an up-to-date page; pages are ordered by id, or by rank and then id when
+    the name is matched by the full-text index"""
     widget_entries = get_widget_entries(event, geo_scope)
-    where_statement, entry_values = generate_where_statement(widget_entries)
-    matching_records = get_matching_records(where_statement, entry_values, geo_scope, connection)
-    return matching_records
+    page_size = event.page_size()
+    continuation_token = event.continuation_token()
+
+    cache_key = (geo_scope, 'search_page', full_text) + get_search_filter(widget_entries) + \
+                (continuation_token, page_size)
+    cached_page = get_cached_results(cache_key, connection)
+    if cached_page is not None:
+        return [cached_page]
+
+    if full_text:
+        widget_entries = apply_full_text_search(widget_entries, geo_scope, connection)
+    filter_shape, entry_values = get_search_filter(widget_entries)
+    statement = get_statement('search_page', geo_scope, filter_shape)
+    is_ranked = FULL_TEXT_FILTER in filter_shape
+
+    if is_ranked:
+        page_key = continuation_token if continuation_token is not None else FIRST_RANKED_PAGE_TOKEN
+    else:
+        page_key = (continuation_token if continuation_token is not None else FIRST_PAGE_TOKEN,)
+
+    # one extra row is fetched to find out whether another page follows
+    cursor = connection.execute(statement, entry_values + tuple(page_key) + (page_size + 1,))
+    rows = cursor.fetchall()
+    cursor.close()
+
+    next_token = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_token = (rows[-1][-1], rows[-1][0]) if is_ranked else rows[-1][0]
+    if is_ranked:
+        rows = [row[:-1] for row in rows]
+
+    page = (tuple(convert_namedtuple(rows, geo_scope, connection)), next_token)
+    cache_results(cache_key, page, len(rows), connection)
+    return [page]
 
 
 def get_widget_entries(event, geo_scope: str) -> dict:
@@ -26,31 +97,34 @@ def get_widget_entries(event, geo_scope: str) -> dict:
     elif geo_scope == 'region':
         widget_entries['region_code'] = event.region_code()
         widget_entries['local_code'] = event.local_code()
+    elif geo_scope == 'airport':
+        widget_entries['airport_ident'] = event.airport_ident()
+        widget_entries['iata_code'] = event.iata_code()
+        widget_entries['gps_code'] = event.gps_code()
+        widget_entries['country_id'] = event.country_id()
+        widget_entries['region_id'] = event.region_id()
 
     widget_entries['name'] = (event.name())
     return widget_entries
 
 
-def generate_where_statement(widget_entries: dict) -> tuple:
-    """Generates a SQL WHERE statement for searching records"""
-    where_statement = ''
+def get_search_filter(widget_entries: dict) -> tuple:
+    """Gets the searched columns and their values from the non-empty widget entries"""
+    filter_shape = list()
     entry_values = list()
 
     for widget, entry in widget_entries.items():
         if entry:
-            if not where_statement:
-                where_statement += f'WHERE {widget} = ? '
-            else:
-                where_statement += f'AND {widget} = ? '
+            filter_shape.append(widget)
             entry_values.append(entry)
-    return where_statement, tuple(entry_values)
+    return tuple(filter_shape), tuple(entry_values)
 
 
-def get_matching_records(where_statement: str, entry_values: tuple, geo_scope: str, connection) -> list:
-    """Gets record with a matching id"""
-    cursor = connection.execute(f'''SELECT * 
-                                    FROM {geo_scope}
-                                    {where_statement};''', entry_values)
-    matching_records = convert_namedtuple(cursor.fetchall(), geo_scope)
-    cursor.close()
-    return matching_records
\ No newline at end of file
+def get_matching_records(statement: str, entry_values: tuple, geo_scope: str, connection) -> Iterator[tuple]:
+    """Yields batches of records matching the searched values"""
+    cursor = connection.execute(statement, entry_values)
+    try:
+        while batch := cursor.fetchmany(SEARCH_BATCH_SIZE):
+            yield tuple(convert_namedtuple(batch, geo_scope, connection))
+    finally:
+        cursor.close()
@@ -5,16 +5,29 @@
 #
 # Utility functions used by all events
 
+from functools import partial
+
+from p2app.engine.utility_functions.sql_profiling import count_converted_rows
+from p2app.events.airports import Airport, AirportFrequency, Runway
 from p2app.events.continents import Continent
 from p2app.events.countries import Country
+from p2app.events.navigation_aids import NavigationAid
 from p2app.events.regions import Region
 
-def convert_namedtuple(records: tuple | list, geo_scope: str):
-    """Converts a tuple to a namedtuple with the desired type"""
-    namedtuple_map = {'continent': Continent, 'country': Country, 'region': Region}
-    converted_records = list()
+RECORD_TYPES = {'continent': Continent, 'country': Country, 'region': Region, 'airport': Airport,
+                'runway': Runway, 'airport_frequency': AirportFrequency, 'navigation_aid': NavigationAid}
+
+# rows already have one value per field, so they are wrapped with tuple.__new__
+# directly rather than unpacked into each namedtuple's __new__
+_record_builders = {geo_scope: partial(tuple.__new__, record_type)
+                    for geo_scope, record_type in RECORD_TYPES.items()}
+
+def convert_namedtuple(records: tuple | list, geo_scope: str, connection = None):
+    """Converts a tuple to a namedtuple with the desired type, counting the converted
+    rows in the SQL profile of the connection they were read through"""
+    build_record = _record_builders[geo_scope]
     if isinstance(records, list):
-        for record in records:
-            converted_records.append(namedtuple_map[geo_scope](*record))
-        return converted_records
-    return [namedtuple_map[geo_scope](*records)]
\ No newline at end of file
+        count_converted_rows(len(records), connection)
+        return list(map(build_record, records))
+    count_converted_rows(1, connection)
+    return [build_record(records)]
@@ -0,0 +1,85 @@
+# p2app/engine/utility_functions/full_text.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Utility functions for full-text searching of names and keywords
+# The FTS5 indexes are temporary tables built per connection on first use
+# and kept in sync with the base tables by temporary triggers
+
+import re
+import sqlite3
+
+from p2app.engine.utility_functions.sql_statements import FULL_TEXT_FILTER
+
+FULL_TEXT_COLUMNS = {'continent': ('name',),
+                     'country': ('name', 'keywords'),
+                     'region': ('name', 'keywords'),
+                     'airport': ('name', 'municipality', 'keywords')}
+
+
+def full_text_available() -> bool:
+    """Checks if the installed SQLite library was built with FTS5"""
+    connection = sqlite3.connect(':memory:')
+    try:
+        connection.execute('CREATE VIRTUAL TABLE fts5_check USING fts5(content);')
+        return True
+    except sqlite3.Error:
+        return False
+    finally:
+        connection.close()
+
+
+FULL_TEXT_AVAILABLE = full_text_available()
+
+
+def apply_full_text_search(widget_entries: dict, geo_scope: str, connection) -> dict:
+    """Replaces an exact name match with a ranked prefix match on names and keywords"""
+    full_text_query = get_full_text_query(widget_entries.get('name'))
+    if not full_text_query:
+        return widget_entries
+
+    ensure_full_text_index(geo_scope, connection)
+    full_text_entries = {widget: entry for widget, entry in widget_entries.items() if widget != 'name'}
+    full_text_entries[FULL_TEXT_FILTER] = full_text_query
+    return full_text_entries
+
+
+def get_full_text_query(name: str | None) -> str:
+    """Converts user input into an FTS5 query matching every token as a prefix"""
+    if not name:
+        return ''
+    tokens = re.findall(r'\w+', name)
+    return ' '.join([f'"{token}"*' for token in tokens])
+
+
+def ensure_full_text_index(geo_scope: str, connection):
+    """Builds the full-text index for a table if this connection lacks one"""
+    cursor = connection.execute('''SELECT 1 FROM sqlite_temp_master
+                                   WHERE type = 'table' AND name = ?;''', (f'{geo_scope}_fts',))
+    index_exists = cursor.fetchone() is not None
+    cursor.close()
+    if index_exists:
+        return
+
+    columns = FULL_TEXT_COLUMNS[geo_scope]
+    column_list = ', '.join(columns)
+    new_values = ', '.join([f'new.{column}' for column in columns])
+    # built in one transaction, so a cancelled build leaves no partial index behind
+    connection.executescript(f'''
+        BEGIN;
+        CREATE VIRTUAL TABLE temp.{geo_scope}_fts USING fts5({column_list}, tokenize = 'unicode61 remove_diacritics 2');
+        INSERT INTO temp.{geo_scope}_fts (rowid, {column_list})
+            SELECT {geo_scope}_id, {column_list} FROM main.{geo_scope};
+
+        CREATE TEMP TRIGGER {geo_scope}_fts_insert AFTER INSERT ON main.{geo_scope} BEGIN
+            INSERT INTO {geo_scope}_fts (rowid, {column_list}) VALUES (new.{geo_scope}_id, {new_values});
+        END;
+        CREATE TEMP TRIGGER {geo_scope}_fts_update AFTER UPDATE ON main.{geo_scope} BEGIN
+            DELETE FROM {geo_scope}_fts WHERE rowid = old.{geo_scope}_id;
+            INSERT INTO {geo_scope}_fts (rowid, {column_list}) VALUES (new.{geo_scope}_id, {new_values});
+        END;
+        CREATE TEMP TRIGGER {geo_scope}_fts_delete AFTER DELETE ON main.{geo_scope} BEGIN
+            DELETE FROM {geo_scope}_fts WHERE rowid = old.{geo_scope}_id;
+        END;
+        COMMIT;''')
@@ -0,0 +1,174 @@
+# p2app/engine/utility_functions/geography_snapshot.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Utility functions for answering continent, country and region searches and loads
+# from an in-memory snapshot of those tables
+# Each table is loaded once per connection into one list per column, ordered by id,
+# with hash indexes from codes and lowercase names to row positions, and the built
+# records are kept alongside so that results need no conversion; saves write
+# through to both SQLite and the snapshot, and any other change to a table (seen
+# through its generation) makes the snapshot reload it
+
+from bisect import bisect_right, insort
+
+from p2app.engine.utility_functions.connection_state import get_connection_state
+from p2app.engine.utility_functions.event_save import table_generation
+from p2app.engine.utility_functions.event_search import SEARCH_BATCH_SIZE, FIRST_PAGE_TOKEN
+from p2app.engine.utility_functions.event_search import get_search_filter, get_widget_entries
+from p2app.engine.utility_functions.event_search import search_database, search_database_page
+from p2app.engine.utility_functions.event_load import get_record_id
+from p2app.engine.utility_functions.event_utils import RECORD_TYPES, convert_namedtuple
+from p2app.engine.utility_functions.sql_statements import TABLE_COLUMNS
+
+SNAPSHOT_INDEXED_COLUMNS = {'continent': ('continent_code', 'name'),
+                            'country': ('country_code', 'name'),
+                            'region': ('region_code', 'local_code', 'name')}
+
+
+def search_snapshot(event, geo_scope: str, connection, full_text: bool = False):
+    """Searches the snapshot for records matching user-inputted constraints, yielding
+    them in batches; ranked full-text name searches are still answered by SQLite"""
+    widget_entries = get_widget_entries(event, geo_scope)
+    if full_text and widget_entries['name']:
+        yield from search_database(event, geo_scope, connection, full_text)
+        return
+
+    table = get_snapshot_table(geo_scope, connection)
+    positions = find_snapshot_positions(table, widget_entries)
+    for start in range(0, len(positions), SEARCH_BATCH_SIZE):
+        yield tuple([table['records'][position] for position in positions[start:start + SEARCH_BATCH_SIZE]])
+
+
+def search_snapshot_page(event, geo_scope: str, connection, full_text: bool = False) -> list:
+    """Searches the snapshot for one page of matching records, ordered by id"""
+    widget_entries = get_widget_entries(event, geo_scope)
+    if full_text and widget_entries['name']:
+        return search_database_page(event, geo_scope, connection, full_text)
+
+    table = get_snapshot_table(geo_scope, connection)
+    positions = find_snapshot_positions(table, widget_entries)
+    after_id = event.continuation_token()
+    if after_id is None:
+        after_id = FIRST_PAGE_TOKEN
+
+    # positions are in id order, so the page starts just past the continuation token
+    ids = table['columns'][0]
+    start = bisect_right(positions, after_id, key=lambda position: ids[position])
+    page_positions = positions[start:start + event.page_size() + 1]
+
+    continuation_token = None
+    if len(page_positions) > event.page_size():
+        page_positions = page_positions[:-1]
+        continuation_token = ids[page_positions[-1]]
+    return [(tuple([table['records'][position] for position in page_positions]), continuation_token)]
+
+
+def load_snapshot_record(event, geo_scope: str, connection) -> list | str:
+    """Loads the record corresponding to the id given by the user from the snapshot"""
+    table = get_snapshot_table(geo_scope, connection)
+    position = table['positions'].get(get_record_id(event, geo_scope))
+    if position is None:
+        return 'Record Not Found'
+    return [table['records'][position]]
+
+
+def save_through_snapshot(event, geo_scope: str, connection, save) -> list | str:
+    """Saves records with the given save operation, then writes the saved records
+    through to the snapshot if it was up to date"""
+    table = get_connection_state(connection, 'snapshot_tables', dict).get(geo_scope)
+    snapshot_current = table is not None and table['generation'] == table_generation(geo_scope, connection)
+
+    result = save(event, geo_scope, connection)
+    if isinstance(result, str) or not snapshot_current:
+        return result
+
+    # a batch save produces (saved records, failures) rather than saved records
+    saved_records = result
+    if result and not isinstance(result[0], RECORD_TYPES[geo_scope]):
+        saved_records = result[0][0]
+    for record in saved_records:
+        write_snapshot_record(table, record)
+    table['generation'] = table_generation(geo_scope, connection)
+    return result
+
+
+def get_snapshot_table(geo_scope: str, connection) -> dict:
+    """Gets the snapshot of a table, loading it if it is missing or out of date"""
+    snapshot_tables = get_connection_state(connection, 'snapshot_tables', dict)
+    table = snapshot_tables.get(geo_scope)
+    if table is None or table['generation'] != table_generation(geo_scope, connection):
+        table = load_snapshot_table(geo_scope, connection)
+        snapshot_tables[geo_scope] = table
+    return table
+
+
+def load_snapshot_table(geo_scope: str, connection) -> dict:
+    """Loads a table into column lists and records ordered by id, along with its hash
+    indexes"""
+    column_names = TABLE_COLUMNS[geo_scope]
+    table = {'geo_scope': geo_scope,
+             'generation': table_generation(geo_scope, connection),
+             'columns': [list() for _ in column_names],
+             'records': list(),
+             'positions': dict(),
+             'indexes': {column_names.index(column): dict() for column in SNAPSHOT_INDEXED_COLUMNS[geo_scope]}}
+
+    cursor = connection.execute(f'SELECT * FROM {geo_scope} ORDER BY {geo_scope}_id;')
+    for record in convert_namedtuple(cursor.fetchall(), geo_scope, connection):
+        append_snapshot_record(table, record)
+    cursor.close()
+    return table
+
+
+def append_snapshot_record(table: dict, record: tuple):
+    """Adds a record with a larger id than any in the snapshot"""
+    position = len(table['columns'][0])
+    for column, value in zip(table['columns'], record):
+        column.append(value)
+    table['records'].append(record)
+    table['positions'][record[0]] = position
+    for column_index, index in table['indexes'].items():
+        index.setdefault(get_index_key(record[column_index]), list()).append(position)
+
+
+def write_snapshot_record(table: dict, record: tuple):
+    """Writes an inserted or updated record through to the snapshot"""
+    position = table['positions'].get(record[0])
+    if position is None:
+        append_snapshot_record(table, record)
+        return
+
+    for column_index, index in table['indexes'].items():
+        old_key = get_index_key(table['columns'][column_index][position])
+        new_key = get_index_key(record[column_index])
+        if old_key != new_key:
+            index[old_key].remove(position)
+            insort(index.setdefault(new_key, list()), position)
+    for column, value in zip(table['columns'], record):
+        column[position] = value
+    table['records'][position] = record
+
+
+def find_snapshot_positions(table: dict, widget_entries: dict) -> list:
+    """Finds the row positions, in id order, of the records whose columns equal every
+    non-empty widget entry, narrowing by the hash indexes before comparing values"""
+    column_names = TABLE_COLUMNS[table['geo_scope']]
+    filter_shape, entry_values = get_search_filter(widget_entries)
+    if not filter_shape:
+        return list(range(len(table['columns'][0])))
+
+    filters = [(column_names.index(column), value) for column, value in zip(filter_shape, entry_values)]
+    candidate_lists = [table['indexes'][column_index].get(get_index_key(value), [])
+                       for column_index, value in filters]
+    positions = min(candidate_lists, key=len)
+    return [position for position in positions
+            if all(table['columns'][column_index][position] == value for column_index, value in filters)]
+
+
+def get_index_key(value):
+    """Gets the hash index key for a value, ignoring the case of text"""
+    if isinstance(value, str):
+        return value.lower()
+    return value
@@ -0,0 +1,67 @@
+# p2app/engine/utility_functions/record_cache.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Least-recently-used cache of loaded records, keyed by (geo_scope, id)
+# Each connection has a cache of its own; saving a record drops it from the cache
+
+from collections import OrderedDict
+
+from p2app.engine.utility_functions.connection_state import get_connection_state
+
+RECORD_CACHE_SIZE = 1024
+
+
+def get_record_cache(connection) -> dict:
+    """Gets a connection's record cache, creating it with the default size"""
+    return get_connection_state(connection, 'record_cache',
+                                lambda: {'records': OrderedDict(), 'size': RECORD_CACHE_SIZE, 'hits': 0, 'misses': 0})
+
+
+def get_cached_record(geo_scope: str, record_id: int, connection) -> tuple | None:
+    """Gets a cached record, marking it as the most recently used"""
+    cache = get_record_cache(connection)
+    key = (geo_scope, record_id)
+    record = cache['records'].get(key)
+    if record is None:
+        cache['misses'] += 1
+        return None
+    cache['hits'] += 1
+    cache['records'].move_to_end(key)
+    return record
+
+
+def cache_record(geo_scope: str, record_id: int, record: tuple, connection):
+    """Caches a loaded record, evicting the least recently used ones beyond the size"""
+    cache = get_record_cache(connection)
+    if cache['size'] <= 0:
+        return
+    cache['records'][(geo_scope, record_id)] = record
+    cache['records'].move_to_end((geo_scope, record_id))
+    while len(cache['records']) > cache['size']:
+        cache['records'].popitem(last=False)
+
+
+def invalidate_record(geo_scope: str, record_id: int | None, connection):
+    """Drops a record from the cache after it has been saved"""
+    get_record_cache(connection)['records'].pop((geo_scope, record_id), None)
+
+
+def set_record_cache_size(size: int, connection):
+    """Sets how many records the cache holds; a size of zero disables it"""
+    cache = get_record_cache(connection)
+    cache['size'] = size
+    while len(cache['records']) > max(size, 0):
+        cache['records'].popitem(last=False)
+
+
+def record_cache_info(connection) -> dict:
+    """Reports hit and miss counters and the hit rate for the record cache"""
+    cache = get_record_cache(connection)
+    lookups = cache['hits'] + cache['misses']
+    return {'hits': cache['hits'],
+            'misses': cache['misses'],
+            'hit_rate': cache['hits'] / lookups if lookups else 0.0,
+            'size': len(cache['records']),
+            'max_size': cache['size']}
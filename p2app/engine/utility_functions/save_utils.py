@@ -7,6 +7,7 @@
 # Used in both inserting and updating
 
 from p2app.engine.utility_functions.event_utils import convert_namedtuple
+from p2app.engine.utility_functions.sql_statements import CODE_COLUMNS, get_statement
 
 def get_record(event, geo_scope: str) -> list:
     """Gets record the user is attempting to insert or update"""
@@ -16,58 +17,70 @@ def get_record(event, geo_scope: str) -> list:
         return list(event.country())
     elif geo_scope == 'region':
         return list(event.region())
+    elif geo_scope == 'airport':
+        return list(event.airport())
+
+
+def get_records(event, geo_scope: str) -> list:
+    """Gets the batch of records the user is attempting to insert or update"""
+    if geo_scope == 'country':
+        return [list(country) for country in event.countries()]
+    elif geo_scope == 'region':
+        return [list(region) for region in event.regions()]
 
 
 def invalid_widget_entries(record: list, geo_scope: str, connection) -> str | None:
     """Flags when the user attempts to pass invalid input"""
     error_message = check_valid_code(record, geo_scope, connection)
     if geo_scope != 'continent':
-        error_message += check_valid_id(record, geo_scope, 'continent', connection)
-        if geo_scope == 'region':
-            error_message += check_valid_id(record, geo_scope, 'country', connection)
+        error_message += check_valid_ids(record, geo_scope, connection)
     if error_message:
         return error_message
 
 
 def check_valid_code(record: list, geo_scope: str, connection) -> str:
-    """Checks if the input code is unique"""
-    cursor = connection.execute(f'''SELECT {geo_scope}_code
-                                    FROM {geo_scope};''')
-    geo_codes = [geo_code[0] for geo_code in cursor]
+    """Checks if the input code is unique, ignoring the record's own row"""
+    cursor = connection.execute(get_statement('check_code', geo_scope), (record[1], record[0]))
+    code_taken = cursor.fetchone() is not None
     cursor.close()
 
-    if record[1] in geo_codes:
-        return f'{geo_scope.capitalize()} Code Taken\n'
+    if code_taken:
+        return code_taken_message(geo_scope)
     return ''
 
 
-def check_valid_id(record: list, geo_scope: str, geo_check: str, connection) -> str:
-    """Checks if the input id exists in the database"""
-    cursor = connection.execute(f'''SELECT {geo_check}_id
-                                    FROM {geo_check};''')
-    geo_ids = [geo_id[0] for geo_id in cursor]
-    cursor.close()
+def code_taken_message(geo_scope: str) -> str:
+    """Gets the error message for a code that another record already uses"""
+    return f"{CODE_COLUMNS[geo_scope].replace('_', ' ').title()} Taken\n"
+
 
-    check_columns = {'country': (3, -1), 'region': (4, 5)}
-    geo_index = check_columns[geo_scope][0]
-    if geo_check == 'country':
-        geo_index = check_columns[geo_scope][1]
+def check_valid_ids(record: list, geo_scope: str, connection) -> str:
+    """Checks if the input ids exist in the database in a single query"""
+    check_columns = {'country': {'continent': 3},
+                     'region': {'continent': 4, 'country': 5},
+                     'airport': {'continent': 7, 'country': 8, 'region': 9}}
+    geo_checks = check_columns[geo_scope]
+    cursor = connection.execute(get_statement('check_ids', geo_scope, tuple(geo_checks)),
+                                tuple(record[geo_index] for geo_index in geo_checks.values()))
+    ids_exist = cursor.fetchone()
+    cursor.close()
 
-    if record[geo_index] not in geo_ids:
-        return f'{geo_check.capitalize()} ID Does Not Exist\n'
-    return''
+    error_message = ''
+    for geo_check, id_exists in zip(geo_checks, ids_exist):
+        if not id_exists:
+            error_message += f'{geo_check.capitalize()} ID Does Not Exist\n'
+    return error_message
 
 
 def handle_empty_widget_entries(record: list, geo_scope: str) -> tuple:
     """Assigns NULL to empty columns that allow NULL entries"""
-    null_columns = {'continent': (-1, -1), 'country': (5, -1), 'region': (6, 7)}
-    null_first = null_columns[geo_scope][0]
-    null_second = null_columns[geo_scope][1]
+    null_columns = {'continent': (), 'country': (5,), 'region': (6, 7),
+                    'airport': (10, 12, 13, 14, 15, 16, 17)}
 
     for i in range(len(record)):
         if isinstance(record[i], str):
             if not record[i]:
-                if i == null_first or i == null_second:
+                if i in null_columns[geo_scope]:
                     record[i] = None
                 else:
                     record[i] = '(unassigned)'
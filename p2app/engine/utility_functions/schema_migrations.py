@@ -0,0 +1,43 @@
+# p2app/engine/utility_functions/schema_migrations.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Utility functions for migrating the schema of an opened database
+# Every step is idempotent, so migrating an already migrated database does nothing
+#
+# Each index on a searched column also holds the rowid, which is the table's id,
+# so a search that pages by id is answered from the index in id order.  The
+# indexes on foreign-key columns keep foreign-key checks from scanning child tables.
+
+import sqlite3
+
+SCHEMA_INDEXES = {'continent_name_index': 'continent (name)',
+                  'country_name_index': 'country (name)',
+                  'country_continent_id_index': 'country (continent_id)',
+                  'region_name_index': 'region (name)',
+                  'region_local_code_index': 'region (local_code)',
+                  'region_continent_id_index': 'region (continent_id)',
+                  'region_country_id_index': 'region (country_id)',
+                  'airport_name_index': 'airport (name)',
+                  'airport_iata_code_index': 'airport (iata_code)',
+                  'airport_gps_code_index': 'airport (gps_code)',
+                  'airport_continent_id_index': 'airport (continent_id)',
+                  'airport_country_id_index': 'airport (country_id)',
+                  'airport_region_id_index': 'airport (region_id)',
+                  'runway_airport_id_index': 'runway (airport_id)',
+                  'airport_frequency_airport_id_index': 'airport_frequency (airport_id)',
+                  'navigation_aid_navigation_aid_id_index': 'navigation_aid (navigation_aid_id)',
+                  'navigation_aid_airport_id_index': 'navigation_aid (airport_id)'}
+
+
+def migrate_schema(connection) -> str:
+    """Creates any missing indexes, reporting whether the migration was applied"""
+    try:
+        for index_name, index_columns in SCHEMA_INDEXES.items():
+            connection.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {index_columns};')
+        connection.commit()
+    except sqlite3.OperationalError as e:
+        connection.rollback()
+        return f'skipped: {e}'
+    return 'applied'
@@ -0,0 +1,69 @@
+# p2app/engine/utility_functions/search_cache.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Least-recently-used cache of search results, keyed by the searched table and
+# the non-empty widget entries; each result remembers the generation of its
+# table, so it is served only until records are next saved to that table
+# Each connection has a cache of its own
+
+from collections import OrderedDict
+
+from p2app.engine.utility_functions.connection_state import get_connection_state
+from p2app.engine.utility_functions.event_save import table_generation
+
+SEARCH_CACHE_ENTRIES = 128
+SEARCH_CACHE_ROWS = 50000
+
+
+def get_search_cache(connection) -> dict:
+    """Gets a connection's search cache, creating it if it has none"""
+    return get_connection_state(connection, 'search_cache',
+                                lambda: {'results': OrderedDict(), 'rows': 0, 'hits': 0, 'misses': 0})
+
+
+def get_cached_results(key: tuple, connection):
+    """Gets a cached search result, or None if it is missing or its table has changed
+    since it was cached; the first element of the key is the searched table"""
+    cache = get_search_cache(connection)
+    cached_result = cache['results'].get(key)
+    if cached_result is None or cached_result[0] != table_generation(key[0], connection):
+        if cached_result is not None:
+            remove_cached_results(key, cache)
+        cache['misses'] += 1
+        return None
+    cache['hits'] += 1
+    cache['results'].move_to_end(key)
+    return cached_result[2]
+
+
+def cache_results(key: tuple, results, row_count: int, connection):
+    """Caches a search result holding row_count records, evicting the least recently
+    used results until both the entry and row limits are met"""
+    if row_count > SEARCH_CACHE_ROWS:
+        return
+    cache = get_search_cache(connection)
+    if key in cache['results']:
+        remove_cached_results(key, cache)
+    cache['results'][key] = (table_generation(key[0], connection), row_count, results)
+    cache['rows'] += row_count
+    while len(cache['results']) > SEARCH_CACHE_ENTRIES or cache['rows'] > SEARCH_CACHE_ROWS:
+        remove_cached_results(next(iter(cache['results'])), cache)
+
+
+def remove_cached_results(key: tuple, cache: dict):
+    """Removes one cached search result"""
+    _, row_count, _ = cache['results'].pop(key)
+    cache['rows'] -= row_count
+
+
+def search_cache_info(connection) -> dict:
+    """Reports hit and miss counters, the hit rate and the size of the search cache"""
+    cache = get_search_cache(connection)
+    lookups = cache['hits'] + cache['misses']
+    return {'hits': cache['hits'],
+            'misses': cache['misses'],
+            'hit_rate': cache['hits'] / lookups if lookups else 0.0,
+            'entries': len(cache['results']),
+            'rows': cache['rows']}
@@ -0,0 +1,146 @@
+# p2app/engine/utility_functions/spatial_search.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Utility functions for finding airports and navigation aids near a point
+# The R*Tree indexes are temporary tables built per connection on first use
+# and kept in sync with the base tables by temporary triggers; the bounding
+# boxes they return are narrowed to the exact radius by haversine distance
+
+import math
+
+from p2app.engine.utility_functions.event_utils import convert_namedtuple
+from p2app.engine.utility_functions.sql_statements import get_statement
+
+EARTH_RADIUS_KM = 6371.0088
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM
+INITIAL_NEAREST_RADIUS_KM = 50.0
+NEAREST_RADIUS_GROWTH = 4
+
+
+def search_nearest(event, geo_scope: str, connection) -> list | str:
+    """Finds the given number of records closest to a point, widening the searched
+    radius until enough of them are found"""
+    latitude, longitude = event.latitude_deg(), event.longitude_deg()
+    count = event.count()
+    if not valid_coordinates(latitude, longitude):
+        return 'Invalid Coordinates'
+    if count <= 0:
+        return 'Invalid Number of Results'
+
+    ensure_spatial_index(geo_scope, connection)
+    radius_km = INITIAL_NEAREST_RADIUS_KM
+    while True:
+        nearby_records = get_records_within_radius(latitude, longitude, radius_km, geo_scope, connection)
+        if len(nearby_records) >= count or radius_km >= MAX_DISTANCE_KM:
+            return [split_nearby_records(nearby_records[:count])]
+        radius_km *= NEAREST_RADIUS_GROWTH
+
+
+def search_within_radius(event, geo_scope: str, connection) -> list | str:
+    """Finds every record within a radius (in kilometers) of a point"""
+    latitude, longitude = event.latitude_deg(), event.longitude_deg()
+    radius_km = event.radius_km()
+    if not valid_coordinates(latitude, longitude):
+        return 'Invalid Coordinates'
+    if radius_km < 0:
+        return 'Invalid Radius'
+
+    ensure_spatial_index(geo_scope, connection)
+    nearby_records = get_records_within_radius(latitude, longitude, radius_km, geo_scope, connection)
+    return [split_nearby_records(nearby_records)]
+
+
+def valid_coordinates(latitude: float, longitude: float) -> bool:
+    """Checks that a point lies on the globe"""
+    return -90 <= latitude <= 90 and -180 <= longitude <= 180
+
+
+def get_records_within_radius(latitude: float, longitude: float, radius_km: float,
+                              geo_scope: str, connection) -> list:
+    """Gets (distance, record) pairs within a radius of a point, closest first"""
+    statement = get_statement('nearby', geo_scope)
+    nearby_records = list()
+    for bounding_box in get_bounding_boxes(latitude, longitude, radius_km):
+        cursor = connection.execute(statement, bounding_box)
+        for record in convert_namedtuple(cursor.fetchall(), geo_scope, connection):
+            distance_km = haversine_distance(latitude, longitude, record.latitude_deg, record.longitude_deg)
+            if distance_km <= radius_km:
+                nearby_records.append((distance_km, record))
+        cursor.close()
+
+    nearby_records.sort(key=lambda nearby_record: nearby_record[0])
+    return nearby_records
+
+
+def split_nearby_records(nearby_records: list) -> tuple:
+    """Splits (distance, record) pairs into a tuple of records and a tuple of distances"""
+    records = tuple([record for _, record in nearby_records])
+    distances_km = tuple([distance_km for distance_km, _ in nearby_records])
+    return records, distances_km
+
+
+def haversine_distance(latitude1: float, longitude1: float, latitude2: float, longitude2: float) -> float:
+    """Gets the great-circle distance between two points in kilometers"""
+    phi1, phi2 = math.radians(latitude1), math.radians(latitude2)
+    delta_phi = phi2 - phi1
+    delta_lambda = math.radians(longitude2 - longitude1)
+    a = math.sin(delta_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def get_bounding_boxes(latitude: float, longitude: float, radius_km: float) -> list:
+    """Gets the (min_lat, max_lat, min_lon, max_lon) boxes covering a circle on the
+    globe, splitting the box in two where it crosses the antimeridian"""
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    min_latitude = latitude - math.degrees(angular_radius)
+    max_latitude = latitude + math.degrees(angular_radius)
+
+    # a circle reaching over a pole covers every longitude
+    if min_latitude <= -90 or max_latitude >= 90 or angular_radius >= math.pi / 2:
+        return [(max(min_latitude, -90.0), min(max_latitude, 90.0), -180.0, 180.0)]
+
+    delta_longitude = math.degrees(math.asin(math.sin(angular_radius) / math.cos(math.radians(latitude))))
+    min_longitude = longitude - delta_longitude
+    max_longitude = longitude + delta_longitude
+
+    if min_longitude < -180:
+        return [(min_latitude, max_latitude, -180.0, max_longitude),
+                (min_latitude, max_latitude, min_longitude + 360, 180.0)]
+    if max_longitude > 180:
+        return [(min_latitude, max_latitude, min_longitude, 180.0),
+                (min_latitude, max_latitude, -180.0, max_longitude - 360)]
+    return [(min_latitude, max_latitude, min_longitude, max_longitude)]
+
+
+def ensure_spatial_index(geo_scope: str, connection):
+    """Builds the R*Tree index over a table's coordinates if this connection lacks one"""
+    cursor = connection.execute('''SELECT 1 FROM sqlite_temp_master
+                                   WHERE type = 'table' AND name = ?;''', (f'{geo_scope}_rtree',))
+    index_exists = cursor.fetchone() is not None
+    cursor.close()
+    if index_exists:
+        return
+
+    # built in one transaction, so a cancelled build leaves no partial index behind
+    connection.executescript(f'''
+        BEGIN;
+        CREATE VIRTUAL TABLE temp.{geo_scope}_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon);
+        INSERT INTO temp.{geo_scope}_rtree (id, min_lat, max_lat, min_lon, max_lon)
+            SELECT {geo_scope}_id, latitude_deg, latitude_deg, longitude_deg, longitude_deg
+            FROM main.{geo_scope};
+
+        CREATE TEMP TRIGGER {geo_scope}_rtree_insert AFTER INSERT ON main.{geo_scope} BEGIN
+            INSERT INTO {geo_scope}_rtree (id, min_lat, max_lat, min_lon, max_lon)
+            VALUES (new.{geo_scope}_id, new.latitude_deg, new.latitude_deg, new.longitude_deg, new.longitude_deg);
+        END;
+        CREATE TEMP TRIGGER {geo_scope}_rtree_update AFTER UPDATE ON main.{geo_scope} BEGIN
+            DELETE FROM {geo_scope}_rtree WHERE id = old.{geo_scope}_id;
+            INSERT INTO {geo_scope}_rtree (id, min_lat, max_lat, min_lon, max_lon)
+            VALUES (new.{geo_scope}_id, new.latitude_deg, new.latitude_deg, new.longitude_deg, new.longitude_deg);
+        END;
+        CREATE TEMP TRIGGER {geo_scope}_rtree_delete AFTER DELETE ON main.{geo_scope} BEGIN
+            DELETE FROM {geo_scope}_rtree WHERE id = old.{geo_scope}_id;
+        END;
+        COMMIT;''')
@@ -0,0 +1,127 @@
+# p2app/engine/utility_functions/sql_profiling.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Connection and cursor classes that time the SQL run through them and count the
+# rows it returns, while SQL profiling is enabled
+# Every database is opened with ProfiledConnection; while profiling is disabled,
+# it hands each statement straight to sqlite3's own cursors
+# The figures are added to the SQL profile attached to the connection, which
+# belongs to the engine that opened it, so two engines never mix their figures
+
+import sqlite3
+import time
+
+
+def new_sql_profile() -> dict:
+    """Makes an SQL profile with nothing recorded and profiling disabled"""
+    return {'enabled': False, 'sql_seconds': 0.0, 'rows_returned': 0, 'rows_converted': 0}
+
+
+def attach_sql_profile(sql_profile: dict, connection):
+    """Makes a connection opened by open_database add its figures to an SQL profile,
+    while that profile is enabled"""
+    connection.sql_profile = sql_profile
+
+
+def count_converted_rows(row_count: int, connection):
+    """Adds rows converted to records to the SQL profile of the connection they were
+    read through, if it has one and it's enabled"""
+    sql_profile = getattr(connection, 'sql_profile', None)
+    if sql_profile is not None and sql_profile['enabled']:
+        sql_profile['rows_converted'] += row_count
+
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """A connection whose statements are timed while its SQL profile is enabled"""
+
+    def __init__(self, *args, **kwargs):
+        """Opens the connection, with an SQL profile of its own until another is attached"""
+        super().__init__(*args, **kwargs)
+        self.sql_profile = new_sql_profile()
+
+
+    def cursor(self, factory = sqlite3.Cursor):
+        """Creates a cursor, which is a profiled one while SQL profiling is enabled"""
+        if self.sql_profile['enabled'] and factory is sqlite3.Cursor:
+            factory = ProfiledCursor
+        return super().cursor(factory)
+
+
+    def execute(self, sql: str, parameters = (), /):
+        """Runs one statement on a new cursor"""
+        if not self.sql_profile['enabled']:
+            return super().execute(sql, parameters)
+        return self.cursor().execute(sql, parameters)
+
+
+    def executemany(self, sql: str, parameters, /):
+        """Runs one statement for each set of parameters on a new cursor"""
+        if not self.sql_profile['enabled']:
+            return super().executemany(sql, parameters)
+        return self.cursor().executemany(sql, parameters)
+
+
+    def executescript(self, script: str, /):
+        """Runs a script of statements on a new cursor"""
+        if not self.sql_profile['enabled']:
+            return super().executescript(script)
+        return self.cursor().executescript(script)
+
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """A cursor that adds the time spent running and stepping its statements, and
+    the rows it returns, to its connection's SQL profile"""
+
+    def execute(self, sql: str, parameters = (), /):
+        """Runs one statement"""
+        return self._timed(super().execute, sql, parameters)
+
+
+    def executemany(self, sql: str, parameters, /):
+        """Runs one statement for each set of parameters"""
+        return self._timed(super().executemany, sql, parameters)
+
+
+    def executescript(self, script: str, /):
+        """Runs a script of statements"""
+        return self._timed(super().executescript, script)
+
+
+    def fetchone(self):
+        """Fetches the next row, or None if there are no more"""
+        row = self._timed(super().fetchone)
+        if row is not None:
+            self.connection.sql_profile['rows_returned'] += 1
+        return row
+
+
+    def fetchmany(self, size: int | None = None) -> list:
+        """Fetches up to size more rows"""
+        rows = self._timed(super().fetchmany, self.arraysize if size is None else size)
+        self.connection.sql_profile['rows_returned'] += len(rows)
+        return rows
+
+
+    def fetchall(self) -> list:
+        """Fetches every remaining row"""
+        rows = self._timed(super().fetchall)
+        self.connection.sql_profile['rows_returned'] += len(rows)
+        return rows
+
+
+    def __next__(self):
+        row = self._timed(super().__next__)
+        self.connection.sql_profile['rows_returned'] += 1
+        return row
+
+
+    def _timed(self, call, *args):
+        started = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            self.connection.sql_profile['sql_seconds'] += time.perf_counter() - started
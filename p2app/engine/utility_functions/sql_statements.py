@@ -0,0 +1,132 @@
+# p2app/engine/utility_functions/sql_statements.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Registry of parameterized SQL statements shared by all events
+# Each statement is built once per (operation, geo_scope, filter shape) and
+# reused afterward, so sqlite3's statement cache sees identical SQL text
+
+STATEMENT_CACHE_SIZE = 256
+
+TABLE_COLUMNS = {'continent': ('continent_id', 'continent_code', 'name'),
+                 'country': ('country_id', 'country_code', 'name', 'continent_id', 'wikipedia_link', 'keywords'),
+                 'region': ('region_id', 'region_code', 'local_code', 'name', 'continent_id', 'country_id',
+                            'wikipedia_link', 'keywords'),
+                 'airport': ('airport_id', 'airport_ident', 'type', 'name', 'latitude_deg', 'longitude_deg',
+                             'elevation_ft', 'continent_id', 'country_id', 'region_id', 'municipality',
+                             'scheduled_service', 'gps_code', 'iata_code', 'local_code', 'home_link',
+                             'wikipedia_link', 'keywords'),
+                 'runway': ('runway_id', 'airport_id', 'length_ft', 'width_ft', 'surface', 'lighted', 'closed',
+                            'le_ident', 'le_latitude_deg', 'le_longitude_deg', 'le_elevation_ft', 'le_heading_deg',
+                            'le_displaced_threshold_ft', 'he_ident', 'he_latitude_deg', 'he_longitude_deg',
+                            'he_elevation_ft', 'he_heading_deg', 'he_displaced_threshold_ft'),
+                 'airport_frequency': ('airport_frequency_id', 'airport_id', 'type', 'description', 'frequency_mhz'),
+                 'navigation_aid': ('navigation_aid_id', 'filename', 'ident', 'name', 'type', 'frequency_khz',
+                                    'latitude_deg', 'longitude_deg', 'elevation_ft', 'iso_country',
+                                    'dme_frequency_khz', 'dme_channel', 'dme_latitude_deg', 'dme_longitude_deg',
+                                    'dme_elevation_ft', 'adjusted_variation_deg', 'magnetic_variation_deg',
+                                    'usage_type', 'power', 'airport_id')}
+
+CODE_COLUMNS = {'continent': 'continent_code', 'country': 'country_code', 'region': 'region_code',
+                'airport': 'airport_ident', 'navigation_aid': 'ident'}
+
+FULL_TEXT_FILTER = 'name MATCH'
+
+_statements = dict()
+_statement_stats = {'hits': 0, 'misses': 0}
+
+
+def get_statement(operation: str, geo_scope: str, filter_shape: tuple = ()) -> str:
+    """Gets the SQL statement for an operation, building it on first use"""
+    key = (operation, geo_scope, filter_shape)
+    statement = _statements.get(key)
+    if statement is None:
+        _statement_stats['misses'] += 1
+        statement = build_statement(operation, geo_scope, filter_shape)
+        _statements[key] = statement
+    else:
+        _statement_stats['hits'] += 1
+    return statement
+
+
+def precompile_statements(geo_scope: str):
+    """Builds the statements for a table that don't depend on a filter shape"""
+    for operation in ('load', 'insert', 'update', 'max_id', 'check_code'):
+        get_statement(operation, geo_scope)
+
+
+def statement_cache_info() -> dict:
+    """Reports hit and miss counters for the statement registry"""
+    return {'hits': _statement_stats['hits'],
+            'misses': _statement_stats['misses'],
+            'size': len(_statements)}
+
+
+def build_statement(operation: str, geo_scope: str, filter_shape: tuple) -> str:
+    """Builds the parameterized SQL text for an operation"""
+    columns = TABLE_COLUMNS[geo_scope]
+
+    if operation in ('search', 'search_page'):
+        return build_search_statement(operation, geo_scope, filter_shape)
+    elif operation == 'load':
+        return f'SELECT * FROM {geo_scope} WHERE {geo_scope}_id = ?;'
+    elif operation == 'load_many':
+        column, placeholder_count = filter_shape
+        placeholders = ', '.join(['?' for _ in range(placeholder_count)])
+        return f'SELECT * FROM {geo_scope} WHERE {column} IN ({placeholders}) ORDER BY {geo_scope}_id;'
+    elif operation == 'insert':
+        return f'''INSERT INTO {geo_scope} ({', '.join(columns)})
+                   VALUES ({', '.join(['?' for _ in columns])});'''
+    elif operation == 'update':
+        set_statement = ', '.join([f'{column} = ?' for column in columns[1:]])
+        return f'UPDATE {geo_scope} SET {set_statement} WHERE {geo_scope}_id = ?;'
+    elif operation == 'max_id':
+        return f'SELECT MAX({geo_scope}_id) FROM {geo_scope};'
+    elif operation == 'check_code':
+        return f'''SELECT 1 FROM {geo_scope}
+                   WHERE {CODE_COLUMNS[geo_scope]} = ? AND {geo_scope}_id IS NOT ?
+                   LIMIT 1;'''
+    elif operation == 'nearby':
+        return f'''SELECT {geo_scope}.* FROM {geo_scope}_rtree
+                   JOIN {geo_scope} ON {geo_scope}.{geo_scope}_id = {geo_scope}_rtree.id
+                   WHERE {geo_scope}_rtree.max_lat >= ? AND {geo_scope}_rtree.min_lat <= ?
+                   AND {geo_scope}_rtree.max_lon >= ? AND {geo_scope}_rtree.min_lon <= ?;'''
+    elif operation == 'check_ids':
+        exists_statements = ', '.join([f'EXISTS(SELECT 1 FROM {geo_check} WHERE {geo_check}_id = ?)'
+                                       for geo_check in filter_shape])
+        return f'SELECT {exists_statements};'
+    raise ValueError(f'Unknown SQL operation: {operation}')
+
+
+def build_search_statement(operation: str, geo_scope: str, filter_shape: tuple) -> str:
+    """Builds the SQL text for searching a table, joining its full-text index when needed;
+    full-text searches are ordered by rank, and select it after the record's columns"""
+    select_statement = f'{geo_scope}.*'
+    from_statement = geo_scope
+    order_statement = ''
+    conditions = list()
+
+    for column in filter_shape:
+        if column == FULL_TEXT_FILTER:
+            from_statement += f' JOIN {geo_scope}_fts ON {geo_scope}_fts.rowid = {geo_scope}.{geo_scope}_id'
+            order_statement = f' ORDER BY {geo_scope}_fts.rank'
+            conditions.append(f'{geo_scope}_fts MATCH ?')
+        else:
+            conditions.append(f'{geo_scope}.{column} = ?')
+
+    if operation == 'search_page':
+        if FULL_TEXT_FILTER in filter_shape:
+            # full-text pages are keyed by (rank, id), so each page continues the ranked
+            # order where the last one ended; ranking sorts every match either way
+            select_statement += f', {geo_scope}_fts.rank'
+            conditions.append(f'({geo_scope}_fts.rank, {geo_scope}_fts.rowid) > (?, ?)')
+            order_statement = f' ORDER BY {geo_scope}_fts.rank, {geo_scope}_fts.rowid LIMIT ?'
+        else:
+            conditions.append(f'{geo_scope}.{geo_scope}_id > ?')
+            order_statement = f' ORDER BY {geo_scope}.{geo_scope}_id LIMIT ?'
+
+    where_statement = ''
+    if conditions:
+        where_statement = ' WHERE ' + ' AND '.join(conditions)
+    return f'SELECT {select_statement} FROM {from_statement}{where_statement}{order_statement};'
@@ -8,8 +8,11 @@
 # YOU WILL NOT NEED TO MODIFY THIS FILE AT ALL
 
 from .event_bus import EventBus
+from .airport_analysis import *
+from .airports import *
 from .app import *
 from .continents import *
 from .countries import *
 from .database import *
+from .navigation_aids import *
 from .regions import *
@@ -0,0 +1,138 @@
+# p2app/events/airport_analysis.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Events that are related to computations spanning many airports at once, such as
+# distances between sets of airports or elevation histograms by region.
+#
+# These computations need NumPy; without it, the engine answers each of them with
+# an ErrorEvent.
+
+
+
+class ComputeAirportDistancesEvent:
+    def __init__(self, origin_airport_ids: tuple[int, ...], destination_airport_ids: tuple[int, ...]):
+        self._origin_airport_ids = origin_airport_ids
+        self._destination_airport_ids = destination_airport_ids
+
+
+    def origin_airport_ids(self) -> tuple[int, ...]:
+        return self._origin_airport_ids
+
+
+    def destination_airport_ids(self) -> tuple[int, ...]:
+        return self._destination_airport_ids
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: origin_airport_ids = {repr(self._origin_airport_ids)}, ' + \
+               f'destination_airport_ids = {repr(self._destination_airport_ids)}'
+
+
+
+class AirportDistancesComputedEvent:
+    def __init__(self, origin_airport_ids: tuple[int, ...], destination_airport_ids: tuple[int, ...],
+                 distances_km: tuple[tuple[float, ...], ...]):
+        self._origin_airport_ids = origin_airport_ids
+        self._destination_airport_ids = destination_airport_ids
+        self._distances_km = distances_km
+
+
+    def origin_airport_ids(self) -> tuple[int, ...]:
+        return self._origin_airport_ids
+
+
+    def destination_airport_ids(self) -> tuple[int, ...]:
+        return self._destination_airport_ids
+
+
+    def distances_km(self) -> tuple[tuple[float, ...], ...]:
+        return self._distances_km
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: origin_airport_ids = {repr(self._origin_airport_ids)}, ' + \
+               f'destination_airport_ids = {repr(self._destination_airport_ids)}, ' + \
+               f'distances_km = {repr(self._distances_km)}'
+
+
+
+class StartAirportBoundingBoxSearchEvent:
+    def __init__(self, min_latitude_deg: float, max_latitude_deg: float,
+                 min_longitude_deg: float, max_longitude_deg: float):
+        self._min_latitude_deg = min_latitude_deg
+        self._max_latitude_deg = max_latitude_deg
+        self._min_longitude_deg = min_longitude_deg
+        self._max_longitude_deg = max_longitude_deg
+
+
+    def min_latitude_deg(self) -> float:
+        return self._min_latitude_deg
+
+
+    def max_latitude_deg(self) -> float:
+        return self._max_latitude_deg
+
+
+    def min_longitude_deg(self) -> float:
+        return self._min_longitude_deg
+
+
+    def max_longitude_deg(self) -> float:
+        return self._max_longitude_deg
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: min_latitude_deg = {repr(self._min_latitude_deg)}, ' + \
+               f'max_latitude_deg = {repr(self._max_latitude_deg)}, ' + \
+               f'min_longitude_deg = {repr(self._min_longitude_deg)}, ' + \
+               f'max_longitude_deg = {repr(self._max_longitude_deg)}'
+
+
+
+class AirportsInBoundingBoxEvent:
+    def __init__(self, airport_ids: tuple[int, ...]):
+        self._airport_ids = airport_ids
+
+
+    def airport_ids(self) -> tuple[int, ...]:
+        return self._airport_ids
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport_ids = {repr(self._airport_ids)}'
+
+
+
+class ComputeElevationHistogramsEvent:
+    def __init__(self, bin_edges_ft: tuple[float, ...]):
+        self._bin_edges_ft = bin_edges_ft
+
+
+    def bin_edges_ft(self) -> tuple[float, ...]:
+        return self._bin_edges_ft
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: bin_edges_ft = {repr(self._bin_edges_ft)}'
+
+
+
+class ElevationHistogramsComputedEvent:
+    def __init__(self, bin_edges_ft: tuple[float, ...], histograms: dict[int, tuple[int, ...]]):
+        self._bin_edges_ft = bin_edges_ft
+        self._histograms = histograms
+
+
+    def bin_edges_ft(self) -> tuple[float, ...]:
+        return self._bin_edges_ft
+
+
+    def histograms(self) -> dict[int, tuple[int, ...]]:
+        return self._histograms
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: bin_edges_ft = {repr(self._bin_edges_ft)}, ' + \
+               f'histograms = {repr(self._histograms)}'
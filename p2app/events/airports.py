@@ -0,0 +1,359 @@
+# p2app/events/airports.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Events that are either related to searching for, creating, or editing airports
+# in the database.
+#
+# Because the airport table is so large, searches for airports are always paged:
+# each search returns at most one page of airports, along with a continuation
+# token that can be sent back to ask for the next page.
+#
+# Airport details bundle an airport together with its runways and frequencies, so
+# that many airports can be loaded at once without a query per airport.
+#
+# Nearby airports are reported closest first, each one alongside its great-circle
+# distance (in kilometers) from the point that was searched.
+
+from collections import namedtuple
+
+
+
+Airport = namedtuple(
+    'Airport',
+    ['airport_id', 'airport_ident', 'type', 'name', 'latitude_deg', 'longitude_deg',
+     'elevation_ft', 'continent_id', 'country_id', 'region_id', 'municipality',
+     'scheduled_service', 'gps_code', 'iata_code', 'local_code', 'home_link',
+     'wikipedia_link', 'keywords'])
+
+Airport.__annotations__ = {
+    'airport_id': int | None,
+    'airport_ident': str | None,
+    'type': str | None,
+    'name': str | None,
+    'latitude_deg': float | None,
+    'longitude_deg': float | None,
+    'elevation_ft': int | None,
+    'continent_id': str | None,
+    'country_id': int | None,
+    'region_id': int | None,
+    'municipality': str | None,
+    'scheduled_service': int | None,
+    'gps_code': str | None,
+    'iata_code': str | None,
+    'local_code': str | None,
+    'home_link': str | None,
+    'wikipedia_link': str | None,
+    'keywords': str | None
+}
+
+
+
+Runway = namedtuple(
+    'Runway',
+    ['runway_id', 'airport_id', 'length_ft', 'width_ft', 'surface', 'lighted', 'closed',
+     'le_ident', 'le_latitude_deg', 'le_longitude_deg', 'le_elevation_ft', 'le_heading_deg',
+     'le_displaced_threshold_ft', 'he_ident', 'he_latitude_deg', 'he_longitude_deg',
+     'he_elevation_ft', 'he_heading_deg', 'he_displaced_threshold_ft'])
+
+Runway.__annotations__ = {
+    'runway_id': int | None,
+    'airport_id': int | None,
+    'length_ft': int | None,
+    'width_ft': int | None,
+    'surface': str | None,
+    'lighted': int | None,
+    'closed': int | None,
+    'le_ident': str | None,
+    'le_latitude_deg': float | None,
+    'le_longitude_deg': float | None,
+    'le_elevation_ft': int | None,
+    'le_heading_deg': float | None,
+    'le_displaced_threshold_ft': int | None,
+    'he_ident': str | None,
+    'he_latitude_deg': float | None,
+    'he_longitude_deg': float | None,
+    'he_elevation_ft': int | None,
+    'he_heading_deg': float | None,
+    'he_displaced_threshold_ft': int | None
+}
+
+
+
+AirportFrequency = namedtuple(
+    'AirportFrequency',
+    ['airport_frequency_id', 'airport_id', 'type', 'description', 'frequency_mhz'])
+
+AirportFrequency.__annotations__ = {
+    'airport_frequency_id': int | None,
+    'airport_id': int | None,
+    'type': str | None,
+    'description': str | None,
+    'frequency_mhz': float | None
+}
+
+
+
+AirportDetails = namedtuple('AirportDetails', ['airport', 'runways', 'frequencies'])
+
+AirportDetails.__annotations__ = {
+    'airport': Airport,
+    'runways': tuple[Runway, ...],
+    'frequencies': tuple[AirportFrequency, ...]
+}
+
+
+class StartAirportSearchEvent:
+    def __init__(self, airport_ident: str, iata_code: str, gps_code: str, name: str,
+                 country_id: int | None, region_id: int | None, page_size: int,
+                 continuation_token: int | tuple[float, int] | None = None):
+        self._airport_ident = airport_ident
+        self._iata_code = iata_code
+        self._gps_code = gps_code
+        self._name = name
+        self._country_id = country_id
+        self._region_id = region_id
+        self._page_size = page_size
+        self._continuation_token = continuation_token
+
+
+    def airport_ident(self) -> str:
+        return self._airport_ident
+
+
+    def iata_code(self) -> str:
+        return self._iata_code
+
+
+    def gps_code(self) -> str:
+        return self._gps_code
+
+
+    def name(self) -> str:
+        return self._name
+
+
+    def country_id(self) -> int | None:
+        return self._country_id
+
+
+    def region_id(self) -> int | None:
+        return self._region_id
+
+
+    def page_size(self) -> int:
+        return self._page_size
+
+
+    def continuation_token(self) -> int | tuple[float, int] | None:
+        return self._continuation_token
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport_ident = {repr(self._airport_ident)}, ' + \
+               f'iata_code = {repr(self._iata_code)}, gps_code = {repr(self._gps_code)}, ' + \
+               f'name = {repr(self._name)}, country_id = {repr(self._country_id)}, ' + \
+               f'region_id = {repr(self._region_id)}, page_size = {repr(self._page_size)}, ' + \
+               f'continuation_token = {repr(self._continuation_token)}'
+
+
+
+class AirportSearchPageEvent:
+    def __init__(self, airports: tuple[Airport, ...], continuation_token: int | tuple[float, int] | None):
+        self._airports = airports
+        self._continuation_token = continuation_token
+
+
+    def airports(self) -> tuple[Airport, ...]:
+        return self._airports
+
+
+    def continuation_token(self) -> int | tuple[float, int] | None:
+        return self._continuation_token
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airports = {repr(self._airports)}, ' + \
+               f'continuation_token = {repr(self._continuation_token)}'
+
+
+
+class LoadAirportEvent:
+    def __init__(self, airport_id: int):
+        self._airport_id = airport_id
+
+
+    def airport_id(self) -> int:
+        return self._airport_id
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport_id = {repr(self._airport_id)}'
+
+
+
+class AirportLoadedEvent:
+    def __init__(self, airport: Airport):
+        self._airport = airport
+
+
+    def airport(self) -> Airport:
+        return self._airport
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport = {repr(self._airport)}'
+
+
+
+class LoadAirportDetailsEvent:
+    def __init__(self, airport_ids: tuple[int, ...]):
+        self._airport_ids = airport_ids
+
+
+    def airport_ids(self) -> tuple[int, ...]:
+        return self._airport_ids
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport_ids = {repr(self._airport_ids)}'
+
+
+
+class AirportDetailsLoadedEvent:
+    def __init__(self, airport_details: tuple[AirportDetails, ...]):
+        self._airport_details = airport_details
+
+
+    def airport_details(self) -> tuple[AirportDetails, ...]:
+        return self._airport_details
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport_details = {repr(self._airport_details)}'
+
+
+class SaveNewAirportEvent:
+    def __init__(self, airport: Airport):
+        self._airport = airport
+
+
+    def airport(self) -> Airport:
+        return self._airport
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport = {repr(self._airport)}'
+
+
+
+class SaveAirportEvent:
+    def __init__(self, airport: Airport):
+        self._airport = airport
+
+
+    def airport(self) -> Airport:
+        return self._airport
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport = {repr(self._airport)}'
+
+
+
+class AirportSavedEvent:
+    def __init__(self, airport: Airport):
+        self._airport = airport
+
+
+    def airport(self) -> Airport:
+        return self._airport
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airport = {repr(self._airport)}'
+
+
+
+class SaveAirportFailedEvent:
+    def __init__(self, reason: str):
+        self._reason = reason
+
+
+    def reason(self) -> str:
+        return self._reason
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: reason = {repr(self._reason)}'
+
+
+
+class StartNearestAirportsSearchEvent:
+    def __init__(self, latitude_deg: float, longitude_deg: float, count: int):
+        self._latitude_deg = latitude_deg
+        self._longitude_deg = longitude_deg
+        self._count = count
+
+
+    def latitude_deg(self) -> float:
+        return self._latitude_deg
+
+
+    def longitude_deg(self) -> float:
+        return self._longitude_deg
+
+
+    def count(self) -> int:
+        return self._count
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: latitude_deg = {repr(self._latitude_deg)}, ' + \
+               f'longitude_deg = {repr(self._longitude_deg)}, count = {repr(self._count)}'
+
+
+
+class StartAirportsWithinRadiusSearchEvent:
+    def __init__(self, latitude_deg: float, longitude_deg: float, radius_km: float):
+        self._latitude_deg = latitude_deg
+        self._longitude_deg = longitude_deg
+        self._radius_km = radius_km
+
+
+    def latitude_deg(self) -> float:
+        return self._latitude_deg
+
+
+    def longitude_deg(self) -> float:
+        return self._longitude_deg
+
+
+    def radius_km(self) -> float:
+        return self._radius_km
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: latitude_deg = {repr(self._latitude_deg)}, ' + \
+               f'longitude_deg = {repr(self._longitude_deg)}, radius_km = {repr(self._radius_km)}'
+
+
+
+class NearbyAirportsEvent:
+    def __init__(self, airports: tuple[Airport, ...], distances_km: tuple[float, ...]):
+        self._airports = airports
+        self._distances_km = distances_km
+
+
+    def airports(self) -> tuple[Airport, ...]:
+        return self._airports
+
+
+    def distances_km(self) -> tuple[float, ...]:
+        return self._distances_km
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: airports = {repr(self._airports)}, ' + \
+               f'distances_km = {repr(self._distances_km)}'
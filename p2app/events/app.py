@@ -10,6 +10,8 @@
 #
 # YOU WILL NOT NEED TO MODIFY THIS FILE AT ALL
 
+from pathlib import Path
+
 
 
 class ErrorEvent:
@@ -35,3 +37,100 @@ class QuitInitiatedEvent:
 class EndApplicationEvent:
     def __repr__(self) -> str:
         return f'{type(self).__name__}'
+
+
+
+class CancelOperationEvent:
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}'
+
+
+
+class OperationCancelledEvent:
+    def __init__(self, operation: str, reason: str, elapsed_seconds: float):
+        self._operation = operation
+        self._reason = reason
+        self._elapsed_seconds = elapsed_seconds
+
+
+    def operation(self) -> str:
+        return self._operation
+
+
+    def reason(self) -> str:
+        return self._reason
+
+
+    def elapsed_seconds(self) -> float:
+        return self._elapsed_seconds
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: operation = {repr(self._operation)}, ' + \
+               f'reason = {repr(self._reason)}, elapsed_seconds = {repr(self._elapsed_seconds)}'
+
+
+
+class EnableProfilingEvent:
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}'
+
+
+
+class DisableProfilingEvent:
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}'
+
+
+
+class CheckProfilingEvent:
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}'
+
+
+
+class ProfilingStateEvent:
+    def __init__(self, is_enabled: bool):
+        self._is_enabled = is_enabled
+
+
+    def is_enabled(self) -> bool:
+        return self._is_enabled
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: is_enabled = {repr(self._is_enabled)}'
+
+
+
+class ExportProfileEvent:
+    def __init__(self, path: Path, profile_format: str):
+        self._path = path
+        self._profile_format = profile_format
+
+
+    def path(self) -> Path:
+        return self._path
+
+
+    def profile_format(self) -> str:
+        return self._profile_format
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: path = {repr(self._path)}, ' + \
+               f'profile_format = {repr(self._profile_format)}'
+
+
+
+class ProfileExportedEvent:
+    def __init__(self, path: Path):
+        self._path = path
+
+
+    def path(self) -> Path:
+        return self._path
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: path = {repr(self._path)}'
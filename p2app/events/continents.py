@@ -57,6 +57,20 @@ class ContinentSearchResultEvent:
 
 
 
+class ContinentSearchResultsBatchEvent:
+    def __init__(self, continents: tuple[Continent, ...]):
+        self._continents = continents
+
+
+    def continents(self) -> tuple[Continent, ...]:
+        return self._continents
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: continents = {repr(self._continents)}'
+
+
+
 class LoadContinentEvent:
     def __init__(self, continent_id: int):
         self._continent_id = continent_id
@@ -62,6 +62,71 @@ class CountrySearchResultEvent:
 
 
 
+class CountrySearchResultsBatchEvent:
+    def __init__(self, countries: tuple[Country, ...]):
+        self._countries = countries
+
+
+    def countries(self) -> tuple[Country, ...]:
+        return self._countries
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: countries = {repr(self._countries)}'
+
+
+
+class StartCountrySearchPageEvent:
+    def __init__(self, country_code: str, name: str, page_size: int,
+                 continuation_token: int | tuple[float, int] | None = None):
+        self._country_code = country_code
+        self._name = name
+        self._page_size = page_size
+        self._continuation_token = continuation_token
+
+
+    def country_code(self) -> str:
+        return self._country_code
+
+
+    def name(self) -> str:
+        return self._name
+
+
+    def page_size(self) -> int:
+        return self._page_size
+
+
+    def continuation_token(self) -> int | tuple[float, int] | None:
+        return self._continuation_token
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: country_code = {repr(self._country_code)}, name = {repr(self._name)}, ' + \
+               f'page_size = {repr(self._page_size)}, continuation_token = {repr(self._continuation_token)}'
+
+
+
+class CountrySearchPageEvent:
+    def __init__(self, countries: tuple[Country, ...], continuation_token: int | tuple[float, int] | None):
+        self._countries = countries
+        self._continuation_token = continuation_token
+
+
+    def countries(self) -> tuple[Country, ...]:
+        return self._countries
+
+
+    def continuation_token(self) -> int | tuple[float, int] | None:
+        return self._continuation_token
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: countries = {repr(self._countries)}, ' + \
+               f'continuation_token = {repr(self._continuation_token)}'
+
+
+
 class LoadCountryEvent:
     def __init__(self, country_id: int):
         self._country_id = country_id
@@ -143,3 +208,36 @@ class SaveCountryFailedEvent:
 
     def __repr__(self) -> str:
         return f'{type(self).__name__}: reason = {repr(self._reason)}'
+
+
+
+class SaveCountriesEvent:
+    def __init__(self, countries: tuple[Country, ...]):
+        self._countries = countries
+
+
+    def countries(self) -> tuple[Country, ...]:
+        return self._countries
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: countries = {repr(self._countries)}'
+
+
+
+class CountriesSavedEvent:
+    def __init__(self, countries: tuple[Country, ...], failures: tuple[tuple[Country, str], ...]):
+        self._countries = countries
+        self._failures = failures
+
+
+    def countries(self) -> tuple[Country, ...]:
+        return self._countries
+
+
+    def failures(self) -> tuple[tuple[Country, str], ...]:
+        return self._failures
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: countries = {repr(self._countries)}, failures = {repr(self._failures)}'
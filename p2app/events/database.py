@@ -34,16 +34,21 @@ class CloseDatabaseEvent:
 
 
 class DatabaseOpenedEvent:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, diagnostics: dict | None = None):
         self._path = path
+        self._diagnostics = diagnostics if diagnostics is not None else {}
 
 
     def path(self) -> Path:
         return self._path
 
 
+    def diagnostics(self) -> dict:
+        return self._diagnostics
+
+
     def __repr__(self) -> str:
-        return f'{type(self).__name__}: path = {repr(self._path)}'
+        return f'{type(self).__name__}: path = {repr(self._path)}, diagnostics = {repr(self._diagnostics)}'
 
 
 
@@ -10,25 +10,69 @@
 #   results routed back to the user interface.
 # * The user interface's internal events are routed back to the user interface
 #   to be processed, with the engine never seeing them.
-#
-# YOU WILL NOT NEED TO MODIFY THIS FILE AT ALL
+# * In asynchronous mode, the engine runs on a worker thread, so that a slow
+#   operation never blocks the user interface.  Its results are queued and
+#   drained on the user interface's thread using after(), in the order in
+#   which they were generated.
+# * Searches are superseded by newer searches of the same type.  In asynchronous
+#   mode, each search is given a generation token; once a newer one has been
+#   initiated, an old one that the engine is running is cancelled, and none of
+#   the old one's results (including the OperationCancelledEvent that cancelling
+#   it produces) are delivered.
+# * Cancelling an operation goes straight to the engine, rather than waiting
+#   behind the operation it is meant to cancel.
+# * An unexpected exception raised by the engine on the worker thread is turned
+#   into an ErrorEvent and delivered like any other result, rather than ending
+#   the worker or going unnoticed.
+
+import queue
+import threading
+import traceback
+from .app import CancelOperationEvent, EndApplicationEvent, ErrorEvent
+from .airports import StartAirportSearchEvent
+from .continents import StartContinentSearchEvent
+from .countries import StartCountrySearchEvent, StartCountrySearchPageEvent
+from .regions import StartRegionSearchEvent, StartRegionSearchPageEvent
+
+
+
+_DRAIN_INTERVAL_MS = 10
+_DRAIN_BATCH_SIZE = 500
+
+_SUPERSEDED_EVENT_TYPES = (
+    StartContinentSearchEvent, StartCountrySearchEvent, StartCountrySearchPageEvent,
+    StartRegionSearchEvent, StartRegionSearchPageEvent, StartAirportSearchEvent)
 
 
 
 class EventBus:
-    def __init__(self):
+    def __init__(self, asynchronous = False):
         self._view = None
         self._engine = None
         self._is_debug_mode = False
+        self._is_asynchronous = asynchronous
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._worker = None
+        self._generations = {}
+        self._running_request = None
+        self._running_lock = threading.Lock()
 
 
     def register_view(self, view):
         self._view = view
 
+        if self._is_asynchronous:
+            self._schedule_drain()
+
 
     def register_engine(self, engine):
         self._engine = engine
 
+        if self._is_asynchronous and self._worker is None:
+            self._worker = threading.Thread(target = self._run_worker, daemon = True)
+            self._worker.start()
+
 
     def enable_debug_mode(self):
         self._is_debug_mode = True
@@ -42,8 +86,92 @@ class EventBus:
         if self._is_debug_mode:
             print(f'Sent by view  : {event}')
 
+        if isinstance(event, CancelOperationEvent):
+            self._engine.cancel_operation()
+            return
+
+        if self._is_asynchronous:
+            generation = None
+
+            if isinstance(event, _SUPERSEDED_EVENT_TYPES):
+                with self._running_lock:
+                    generation = self._generations.get(type(event), 0) + 1
+                    self._generations[type(event)] = generation
+
+                    if self._running_request is not None and type(self._running_request[0]) is type(event):
+                        self._engine.cancel_operation()
+
+            self._requests.put((event, generation))
+            return
+
         for result_event in self._engine.process_event(event):
-            if self._is_debug_mode:
-                print(f'Sent by engine: {result_event}')
+            self._deliver_result(result_event)
+
+
+    def _deliver_result(self, result_event):
+        if self._is_debug_mode:
+            print(f'Sent by engine: {result_event}')
+
+        self._view.handle_event(result_event)
+
+
+    def _is_superseded(self, event, generation):
+        return generation is not None and self._generations[type(event)] != generation
+
+
+    def _run_worker(self):
+        while True:
+            request = self._requests.get()
+
+            if request is None:
+                break
+
+            event, generation = request
+
+            with self._running_lock:
+                if self._is_superseded(event, generation):
+                    continue
+
+                self._running_request = request
+
+            result_events = self._engine.process_event(event)
+
+            try:
+                for result_event in result_events:
+                    if self._is_superseded(event, generation):
+                        break
+
+                    self._results.put((result_event, event, generation))
+            except Exception as e:
+                if self._is_debug_mode:
+                    traceback.print_exc()
+
+                self._results.put((ErrorEvent(f'Unexpected Engine Error: {e}'), event, generation))
+            finally:
+                result_events.close()
+
+                with self._running_lock:
+                    self._running_request = None
+
+
+    def _schedule_drain(self):
+        self._view.after(_DRAIN_INTERVAL_MS, self._drain_results)
+
+
+    def _drain_results(self):
+        for _ in range(_DRAIN_BATCH_SIZE):
+            try:
+                result_event, event, generation = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if self._is_superseded(event, generation):
+                continue
+
+            self._deliver_result(result_event)
+
+            if isinstance(result_event, EndApplicationEvent):
+                self._requests.put(None)
+                return
 
-            self._view.handle_event(result_event)
+        self._schedule_drain()
@@ -0,0 +1,114 @@
+# p2app/events/navigation_aids.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Events that are related to finding navigation aids near a point.
+#
+# Nearby navigation aids are reported closest first, each one alongside its
+# great-circle distance (in kilometers) from the point that was searched.
+
+from collections import namedtuple
+
+
+
+NavigationAid = namedtuple(
+    'NavigationAid',
+    ['navigation_aid_id', 'filename', 'ident', 'name', 'type', 'frequency_khz',
+     'latitude_deg', 'longitude_deg', 'elevation_ft', 'iso_country',
+     'dme_frequency_khz', 'dme_channel', 'dme_latitude_deg', 'dme_longitude_deg',
+     'dme_elevation_ft', 'adjusted_variation_deg', 'magnetic_variation_deg',
+     'usage_type', 'power', 'airport_id'])
+
+NavigationAid.__annotations__ = {
+    'navigation_aid_id': int | None,
+    'filename': str | None,
+    'ident': str | None,
+    'name': str | None,
+    'type': str | None,
+    'frequency_khz': int | None,
+    'latitude_deg': float | None,
+    'longitude_deg': float | None,
+    'elevation_ft': int | None,
+    'iso_country': str | None,
+    'dme_frequency_khz': int | None,
+    'dme_channel': str | None,
+    'dme_latitude_deg': float | None,
+    'dme_longitude_deg': float | None,
+    'dme_elevation_ft': int | None,
+    'adjusted_variation_deg': float | None,
+    'magnetic_variation_deg': float | None,
+    'usage_type': str | None,
+    'power': str | None,
+    'airport_id': int | None
+}
+
+
+
+class StartNearestNavigationAidsSearchEvent:
+    def __init__(self, latitude_deg: float, longitude_deg: float, count: int):
+        self._latitude_deg = latitude_deg
+        self._longitude_deg = longitude_deg
+        self._count = count
+
+
+    def latitude_deg(self) -> float:
+        return self._latitude_deg
+
+
+    def longitude_deg(self) -> float:
+        return self._longitude_deg
+
+
+    def count(self) -> int:
+        return self._count
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: latitude_deg = {repr(self._latitude_deg)}, ' + \
+               f'longitude_deg = {repr(self._longitude_deg)}, count = {repr(self._count)}'
+
+
+
+class StartNavigationAidsWithinRadiusSearchEvent:
+    def __init__(self, latitude_deg: float, longitude_deg: float, radius_km: float):
+        self._latitude_deg = latitude_deg
+        self._longitude_deg = longitude_deg
+        self._radius_km = radius_km
+
+
+    def latitude_deg(self) -> float:
+        return self._latitude_deg
+
+
+    def longitude_deg(self) -> float:
+        return self._longitude_deg
+
+
+    def radius_km(self) -> float:
+        return self._radius_km
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: latitude_deg = {repr(self._latitude_deg)}, ' + \
+               f'longitude_deg = {repr(self._longitude_deg)}, radius_km = {repr(self._radius_km)}'
+
+
+
+class NearbyNavigationAidsEvent:
+    def __init__(self, navigation_aids: tuple[NavigationAid, ...], distances_km: tuple[float, ...]):
+        self._navigation_aids = navigation_aids
+        self._distances_km = distances_km
+
+
+    def navigation_aids(self) -> tuple[NavigationAid, ...]:
+        return self._navigation_aids
+
+
+    def distances_km(self) -> tuple[float, ...]:
+        return self._distances_km
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: navigation_aids = {repr(self._navigation_aids)}, ' + \
+               f'distances_km = {repr(self._distances_km)}'
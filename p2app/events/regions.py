@@ -71,6 +71,77 @@ class RegionSearchResultEvent:
 
 
 
+class RegionSearchResultsBatchEvent:
+    def __init__(self, regions: tuple[Region, ...]):
+        self._regions = regions
+
+
+    def regions(self) -> tuple[Region, ...]:
+        return self._regions
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: regions = {repr(self._regions)}'
+
+
+
+class StartRegionSearchPageEvent:
+    def __init__(self, region_code: str, local_code: str, name: str, page_size: int,
+                 continuation_token: int | tuple[float, int] | None = None):
+        self._region_code = region_code
+        self._local_code = local_code
+        self._name = name
+        self._page_size = page_size
+        self._continuation_token = continuation_token
+
+
+    def region_code(self) -> str:
+        return self._region_code
+
+
+    def local_code(self) -> str:
+        return self._local_code
+
+
+    def name(self) -> str:
+        return self._name
+
+
+    def page_size(self) -> int:
+        return self._page_size
+
+
+    def continuation_token(self) -> int | tuple[float, int] | None:
+        return self._continuation_token
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: region_code = {repr(self._region_code)}, ' + \
+               f'local_code = {repr(self._local_code)}, name = {repr(self._name)}, ' + \
+               f'page_size = {repr(self._page_size)}, continuation_token = {repr(self._continuation_token)}'
+
+
+
+class RegionSearchPageEvent:
+    def __init__(self, regions: tuple[Region, ...], continuation_token: int | tuple[float, int] | None):
+        self._regions = regions
+        self._continuation_token = continuation_token
+
+
+    def regions(self) -> tuple[Region, ...]:
+        return self._regions
+
+
+    def continuation_token(self) -> int | tuple[float, int] | None:
+        return self._continuation_token
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: regions = {repr(self._regions)}, ' + \
+               f'continuation_token = {repr(self._continuation_token)}'
+
+
+
 class LoadRegionEvent:
     def __init__(self, region_id: int):
         self._region_id = region_id
@@ -152,3 +223,36 @@ class SaveRegionFailedEvent:
 
     def __repr__(self) -> str:
         return f'{type(self).__name__}: reason = {repr(self._reason)}'
+
+
+
+class SaveRegionsEvent:
+    def __init__(self, regions: tuple[Region, ...]):
+        self._regions = regions
+
+
+    def regions(self) -> tuple[Region, ...]:
+        return self._regions
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: regions = {repr(self._regions)}'
+
+
+
+class RegionsSavedEvent:
+    def __init__(self, regions: tuple[Region, ...], failures: tuple[tuple[Region, str], ...]):
+        self._regions = regions
+        self._failures = failures
+
+
+    def regions(self) -> tuple[Region, ...]:
+        return self._regions
+
+
+    def failures(self) -> tuple[tuple[Region, str], ...]:
+        return self._failures
+
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}: regions = {repr(self._regions)}, failures = {repr(self._failures)}'
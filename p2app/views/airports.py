@@ -0,0 +1,380 @@
+# p2app/views/airports.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# This is the portion of the user interface that is displayed when the
+# Edit / Airports menu item is selected.
+#
+# The airport table is much larger than the others, so airport searches are
+# always paged, with the next page requested when the search list is scrolled
+# to its end.
+
+import tkinter
+import tkinter.messagebox
+from p2app.events import *
+from .event_handling import EventHandler
+from .events import *
+
+
+
+_SEARCH_PAGE_SIZE = 100
+
+# The fields shown in the airport editor, in order, as (label, field name, entry
+# width, type).  The type is used to convert the entered text when saving; a type
+# of None means the text is saved as it is.
+_EDITOR_FIELDS = [
+    ('Airport Ident', 'airport_ident', 10, None),
+    ('Type', 'type', 20, None),
+    ('Name', 'name', 50, None),
+    ('Latitude', 'latitude_deg', 20, float),
+    ('Longitude', 'longitude_deg', 20, float),
+    ('Elevation (ft)', 'elevation_ft', 10, 'optional int'),
+    ('Continent ID', 'continent_id', 10, None),
+    ('Country ID', 'country_id', 10, int),
+    ('Region ID', 'region_id', 10, int),
+    ('Municipality', 'municipality', 30, None),
+    ('Scheduled Service', 'scheduled_service', 10, int),
+    ('GPS Code', 'gps_code', 10, None),
+    ('IATA Code', 'iata_code', 10, None),
+    ('Local Code', 'local_code', 10, None),
+    ('Home Link', 'home_link', 50, None),
+    ('Wikipedia Link', 'wikipedia_link', 50, None),
+    ('Keywords', 'keywords', 50, None)
+]
+
+
+
+class AirportsView(tkinter.Frame, EventHandler):
+    handled_events = (
+        SaveAirportFailedEvent, DiscardAirportEvent, NewAirportEvent, StartEditingAirportEvent,
+        AirportLoadedEvent, AirportSavedEvent)
+
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.subscribe_events()
+
+        search_view = _AirportsSearchView(self)
+        search_view.grid(row = 0, column = 0, sticky = tkinter.NSEW)
+
+        self._edit_view = None
+
+        self.rowconfigure(0, weight = 0)
+        self.rowconfigure(1, weight = 1)
+        self.columnconfigure(0, weight = 1)
+
+
+    def on_event(self, event):
+        if isinstance(event, SaveAirportFailedEvent):
+            tkinter.messagebox.showerror('Save Airport Failed', event.reason())
+
+
+    def on_event_post(self, event):
+        if isinstance(event, DiscardAirportEvent):
+            self._switch_edit_view(None)
+        elif isinstance(event, NewAirportEvent):
+            self._switch_edit_view(_AirportEditorView(self, True, True, None))
+        elif isinstance(event, StartEditingAirportEvent):
+            self._switch_edit_view(_AirportEditorLoadingView(self))
+        elif isinstance(event, AirportLoadedEvent):
+            self._switch_edit_view(_AirportEditorView(self, False, True, event.airport()))
+        elif isinstance(event, AirportSavedEvent):
+            self._switch_edit_view(_AirportEditorView(self, False, False, event.airport()))
+
+
+    def _switch_edit_view(self, edit_view):
+        if self._edit_view:
+            self._edit_view.destroy()
+            self._edit_view = None
+
+        if edit_view:
+            self._edit_view = edit_view
+            self._edit_view.grid(row = 1, column = 0, padx = 5, pady = 5, sticky = tkinter.NSEW)
+
+
+
+class _AirportsSearchView(tkinter.LabelFrame, EventHandler):
+    handled_events = (ClearAirportsSearchListEvent, AirportSearchPageEvent, OperationCancelledEvent, ErrorEvent)
+
+
+    def __init__(self, parent):
+        super().__init__(parent, text = 'Airport Search')
+        self.subscribe_events()
+
+        self._search_fields = {}
+
+        search_fields = [
+            ('Airport Ident: ', 'airport_ident', 10),
+            ('IATA Code: ', 'iata_code', 10),
+            ('GPS Code: ', 'gps_code', 10),
+            ('Name: ', 'name', 30),
+            ('Country ID: ', 'country_id', 10),
+            ('Region ID: ', 'region_id', 10)
+        ]
+
+        for row, (label_text, field_name, width) in enumerate(search_fields):
+            label = tkinter.Label(self, text = label_text)
+            label.grid(row = row, column = 0, padx = 5, pady = 5, sticky = tkinter.E)
+
+            search_value = tkinter.StringVar()
+            search_value.trace_add('write', self._on_search_changed)
+            self._search_fields[field_name] = search_value
+
+            entry = tkinter.Entry(self, textvariable = search_value, width = width)
+            entry.grid(row = row, column = 1, sticky = tkinter.W, padx = 5, pady = 5)
+
+        self._search_button = tkinter.Button(
+            self, text = 'Search', state = tkinter.DISABLED,
+            command = self._on_search_button_clicked)
+
+        self._search_button.grid(row = 6, column = 1, sticky = tkinter.E, padx = 5, pady = 5)
+
+        empty_area = tkinter.Label(self, text = '')
+        empty_area.grid(row = 7, column = 1, sticky = tkinter.NSEW, padx = 5, pady = 5)
+
+        self._search_list = tkinter.Listbox(
+            self, height = 4,
+            activestyle = tkinter.NONE, selectmode = tkinter.SINGLE,
+            yscrollcommand = self._on_search_list_scrolled)
+
+        self._search_list.bind('<<ListboxSelect>>', self._on_search_selection_changed)
+        self._search_list.grid(
+            row = 0, column = 2, rowspan = 7, columnspan = 1, sticky = tkinter.NSEW,
+            padx = 5, pady = 5)
+
+        self._search_airport_ids = []
+        self._search_criteria = None
+        self._search_continuation_token = None
+        self._is_search_page_pending = False
+
+        button_frame = tkinter.Frame(self)
+        button_frame.grid(row = 8, column = 2, sticky = tkinter.E, padx = 5, pady = 5)
+
+        self._new_button = tkinter.Button(
+            button_frame, text = 'New Airport',
+            command = self._on_new_airport)
+
+        self._new_button.grid(row = 0, column = 0, padx = 5, pady = 5)
+
+        self._edit_button = tkinter.Button(
+            button_frame, text = 'Edit Airport', state = tkinter.DISABLED,
+            command = self._on_edit_airport)
+
+        self._edit_button.grid(row = 0, column = 1, padx = 5, pady = 5)
+
+        for row in range(9):
+            self.rowconfigure(row, weight = 0)
+
+        self.rowconfigure(7, weight = 1)
+        self.columnconfigure(0, weight = 0)
+        self.columnconfigure(1, weight = 1)
+        self.columnconfigure(2, weight = 2)
+
+
+    def _on_search_button_clicked(self):
+        try:
+            country_id = self._get_search_id('country_id')
+            region_id = self._get_search_id('region_id')
+        except ValueError:
+            tkinter.messagebox.showerror(
+                'Airport Search Failed', 'Country ID and Region ID must be integers')
+            return
+
+        self.initiate_event(ClearAirportsSearchListEvent())
+        self._search_criteria = (
+            self._get_search_text('airport_ident'), self._get_search_text('iata_code'),
+            self._get_search_text('gps_code'), self._get_search_text('name'),
+            country_id, region_id)
+        self._request_search_page(None)
+
+
+    def _request_search_page(self, continuation_token):
+        self._is_search_page_pending = True
+        self.initiate_event(StartAirportSearchEvent(
+            *self._search_criteria, _SEARCH_PAGE_SIZE, continuation_token))
+
+
+    def _on_search_list_scrolled(self, first, last):
+        if float(last) >= 1.0 and self._search_continuation_token is not None \
+                and not self._is_search_page_pending:
+            self._request_search_page(self._search_continuation_token)
+
+
+    def _get_search_text(self, field_name):
+        text = self._search_fields[field_name].get().strip()
+        return text if len(text) > 0 else None
+
+
+    def _get_search_id(self, field_name):
+        text = self._get_search_text(field_name)
+        return int(text) if text is not None else None
+
+
+    def _get_selected_search_airport_id(self):
+        selection, *_ = self._search_list.curselection()
+        return self._search_airport_ids[selection]
+
+
+    def _on_search_changed(self, *args):
+        if any(len(search_value.get().strip()) > 0 for search_value in self._search_fields.values()):
+            new_state = tkinter.NORMAL
+        else:
+            new_state = tkinter.DISABLED
+
+        self._search_button['state'] = new_state
+        return True
+
+
+    def _on_search_selection_changed(self, event):
+        if event.widget.curselection():
+            new_state = tkinter.NORMAL
+        else:
+            new_state = tkinter.DISABLED
+
+        self._edit_button['state'] = new_state
+
+
+    def _on_new_airport(self):
+        self.initiate_event(DiscardAirportEvent())
+        self.initiate_event(NewAirportEvent())
+
+
+    def _on_edit_airport(self):
+        self.initiate_event(DiscardAirportEvent())
+        self.initiate_event(StartEditingAirportEvent())
+        self.initiate_event(LoadAirportEvent(self._get_selected_search_airport_id()))
+
+
+    def on_event(self, event):
+        if isinstance(event, ClearAirportsSearchListEvent):
+            self._search_list.delete(0, tkinter.END)
+            self._search_airport_ids = []
+            self._search_continuation_token = None
+            self._is_search_page_pending = False
+            self._edit_button['state'] = tkinter.DISABLED
+        elif isinstance(event, AirportSearchPageEvent):
+            display_names = [f'{airport.airport_ident} - {airport.name}' for airport in event.airports()]
+            self._search_list.insert(tkinter.END, *display_names)
+            self._search_airport_ids.extend(airport.airport_id for airport in event.airports())
+            self._search_continuation_token = event.continuation_token()
+            self._is_search_page_pending = False
+        elif isinstance(event, OperationCancelledEvent):
+            # a cancelled page ends the search, rather than being asked for again
+            if event.operation() == StartAirportSearchEvent.__name__:
+                self._search_continuation_token = None
+                self._is_search_page_pending = False
+        elif isinstance(event, ErrorEvent):
+            # a failed page can be asked for again by scrolling to the end once more
+            self._is_search_page_pending = False
+
+
+
+class _AirportEditorLoadingView(tkinter.LabelFrame, EventHandler):
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        loading_label = tkinter.Label(self, text = 'Loading...')
+        loading_label.grid(row = 0, column = 0, padx = 5, pady = 5, sticky = tkinter.W)
+
+
+
+class _AirportEditorView(tkinter.LabelFrame, EventHandler):
+    def __init__(self, parent, is_new, is_editable, airport):
+        if is_new:
+            frame_text = 'New Airport'
+        elif is_editable:
+            frame_text = 'Edit Airport'
+        else:
+            frame_text = 'Airport Saved'
+
+        super().__init__(parent, text = frame_text)
+
+        self._is_new = is_new
+        self._airport_id = airport.airport_id if airport else None
+
+        airport_id_label = tkinter.Label(self, text = 'Airport ID: ')
+        airport_id_label.grid(row = 0, column = 0, padx = 5, pady = 5, sticky = tkinter.E)
+
+        airport_id_value_label_text = f'{self._airport_id if self._airport_id else "(New)"}'
+        airport_id_value_label = tkinter.Label(self, text = airport_id_value_label_text)
+        airport_id_value_label.grid(row = 0, column = 1, padx = 5, pady = 5, sticky = tkinter.W)
+
+        self._field_values = {}
+
+        for row, (label_text, field_name, width, _) in enumerate(_EDITOR_FIELDS, start = 1):
+            value = getattr(airport, field_name) if airport else None
+
+            field_value = tkinter.StringVar()
+            field_value.set('' if value is None else str(value))
+            self._field_values[field_name] = field_value
+
+            label = tkinter.Label(self, text = f'{label_text}: ')
+            label.grid(row = row, column = 0, padx = 5, pady = 5, sticky = tkinter.E)
+
+            if is_editable:
+                entry = tkinter.Entry(self, textvariable = field_value, width = width)
+            else:
+                entry = tkinter.Label(self, textvariable = field_value)
+
+            entry.grid(row = row, column = 1, padx = 5, pady = 5, sticky = tkinter.W)
+
+        button_row = len(_EDITOR_FIELDS) + 2
+
+        button_frame = tkinter.Frame(self)
+        button_frame.grid(row = button_row, column = 1, padx = 5, pady = 5, sticky = tkinter.SE)
+
+        if is_editable:
+            save_button = tkinter.Button(button_frame, text = 'Save', command = self._on_save)
+            save_button.grid(row = 0, column = 0, padx = 5, pady = 5)
+
+        discard_button = tkinter.Button(button_frame, text = 'Discard', command = self._on_discard)
+        discard_button.grid(row = 0, column = 1, padx = 5, pady = 5)
+
+        for row in range(button_row + 1):
+            self.rowconfigure(row, weight = 0)
+
+        self.rowconfigure(button_row - 1, weight = 1)
+        self.columnconfigure(0, weight = 0)
+        self.columnconfigure(1, weight = 1)
+
+
+    def _on_save(self):
+        airport = self._make_airport()
+
+        if airport:
+            if self._is_new:
+                self.initiate_event(SaveNewAirportEvent(airport))
+            else:
+                self.initiate_event(SaveAirportEvent(airport))
+
+
+    def _on_discard(self):
+        self.initiate_event(DiscardAirportEvent())
+
+
+    def _make_airport(self):
+        failure_reasons = []
+        values = {}
+
+        for label_text, field_name, _, field_type in _EDITOR_FIELDS:
+            text = self._field_values[field_name].get()
+
+            if field_type is None:
+                values[field_name] = text
+            elif field_type == 'optional int' and len(text.strip()) == 0:
+                values[field_name] = None
+            else:
+                converter = int if field_type == 'optional int' else field_type
+
+                try:
+                    values[field_name] = converter(text)
+                except ValueError:
+                    type_name = 'an integer' if converter is int else 'a number'
+                    failure_reasons.append(f'{label_text} must be {type_name}')
+
+        if failure_reasons:
+            tkinter.messagebox.showerror('Save Airport Failed', '\n'.join(failure_reasons))
+            return None
+        else:
+            return Airport(self._airport_id, **values)
@@ -16,9 +16,19 @@ from .events import *
 
 
 
+_SEARCH_DELAY_MS = 250
+
+
+
 class ContinentsView(tkinter.Frame, EventHandler):
+    handled_events = (
+        SaveContinentFailedEvent, DiscardContinentEvent, NewContinentEvent, StartEditingContinentEvent,
+        ContinentLoadedEvent, ContinentSavedEvent)
+
+
     def __init__(self, parent):
         super().__init__(parent)
+        self.subscribe_events()
 
         search_view = _ContinentsSearchView(self)
         search_view.grid(row = 0, column = 0, sticky = tkinter.NSEW)
@@ -59,8 +69,13 @@ class ContinentsView(tkinter.Frame, EventHandler):
 
 
 class _ContinentsSearchView(tkinter.LabelFrame, EventHandler):
+    handled_events = (
+        ClearContinentsSearchListEvent, ContinentSearchResultEvent, ContinentSearchResultsBatchEvent)
+
+
     def __init__(self, parent):
         super().__init__(parent, text = 'Continent Search')
+        self.subscribe_events()
 
         code_label = tkinter.Label(self, text = 'Continent Code: ')
         code_label.grid(row = 0, column = 0, padx = 5, pady = 5, sticky = tkinter.E)
@@ -99,6 +114,8 @@ class _ContinentsSearchView(tkinter.LabelFrame, EventHandler):
             padx = 5, pady = 5)
 
         self._search_continent_ids = []
+        self._search_criteria = None
+        self._search_after_id = None
 
         button_frame = tkinter.Frame(self)
         button_frame.grid(row = 4, column = 2, sticky = tkinter.E, padx = 5, pady = 5)
@@ -127,7 +144,8 @@ class _ContinentsSearchView(tkinter.LabelFrame, EventHandler):
 
     def _on_search_button_clicked(self):
         self.initiate_event(ClearContinentsSearchListEvent())
-        self.initiate_event(StartContinentSearchEvent(self._get_search_code(), self._get_search_name()))
+        self._search_criteria = (self._get_search_code(), self._get_search_name())
+        self.initiate_event(StartContinentSearchEvent(*self._search_criteria))
 
 
     def _get_search_code(self):
@@ -152,9 +170,26 @@ class _ContinentsSearchView(tkinter.LabelFrame, EventHandler):
             new_state = tkinter.DISABLED
 
         self._search_button['state'] = new_state
+
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+
+        self._search_after_id = self.after(_SEARCH_DELAY_MS, self._on_search_settled)
         return True
 
 
+    def _on_search_settled(self):
+        self._search_after_id = None
+
+        if not self.winfo_exists():
+            return
+
+        search_criteria = (self._get_search_code(), self._get_search_name())
+
+        if search_criteria != self._search_criteria and search_criteria != (None, None):
+            self._on_search_button_clicked()
+
+
     def _on_search_selection_changed(self, event):
         if event.widget.curselection():
             new_state = tkinter.NORMAL
@@ -184,6 +219,10 @@ class _ContinentsSearchView(tkinter.LabelFrame, EventHandler):
             display_name = f'{event.continent().continent_code} - {event.continent().name}'
             self._search_list.insert(tkinter.END, display_name)
             self._search_continent_ids.append(event.continent().continent_id)
+        elif isinstance(event, ContinentSearchResultsBatchEvent):
+            display_names = [f'{continent.continent_code} - {continent.name}' for continent in event.continents()]
+            self._search_list.insert(tkinter.END, *display_names)
+            self._search_continent_ids.extend(continent.continent_id for continent in event.continents())
 
 
 
@@ -16,9 +16,20 @@ from .events import *
 
 
 
+_SEARCH_PAGE_SIZE = 100
+_SEARCH_DELAY_MS = 250
+
+
+
 class CountriesView(tkinter.Frame, EventHandler):
+    handled_events = (
+        SaveCountryFailedEvent, DiscardCountryEvent, NewCountryEvent, StartEditingCountryEvent,
+        CountryLoadedEvent, CountrySavedEvent)
+
+
     def __init__(self, parent):
         super().__init__(parent)
+        self.subscribe_events()
 
         search_view = _CountriesSearchView(self)
         search_view.grid(row = 0, column = 0, sticky = tkinter.NSEW)
@@ -60,8 +71,14 @@ class CountriesView(tkinter.Frame, EventHandler):
 
 
 class _CountriesSearchView(tkinter.LabelFrame, EventHandler):
+    handled_events = (
+        ClearCountriesSearchListEvent, CountrySearchResultEvent, CountrySearchResultsBatchEvent, CountrySearchPageEvent,
+        OperationCancelledEvent, ErrorEvent)
+
+
     def __init__(self, parent):
         super().__init__(parent, text = 'Country Search')
+        self.subscribe_events()
 
         code_label = tkinter.Label(self, text = 'Country Code: ')
         code_label.grid(row = 0, column = 0, padx = 5, pady = 5, sticky = tkinter.E)
@@ -92,7 +109,8 @@ class _CountriesSearchView(tkinter.LabelFrame, EventHandler):
 
         self._search_list = tkinter.Listbox(
             self, height = 4,
-            activestyle = tkinter.NONE, selectmode = tkinter.SINGLE)
+            activestyle = tkinter.NONE, selectmode = tkinter.SINGLE,
+            yscrollcommand = self._on_search_list_scrolled)
 
         self._search_list.bind('<<ListboxSelect>>', self._on_search_selection_changed)
         self._search_list.grid(
@@ -100,6 +118,10 @@ class _CountriesSearchView(tkinter.LabelFrame, EventHandler):
             padx = 5, pady = 5)
 
         self._search_country_ids = []
+        self._search_criteria = None
+        self._search_continuation_token = None
+        self._is_search_page_pending = False
+        self._search_after_id = None
 
         button_frame = tkinter.Frame(self)
         button_frame.grid(row = 4, column = 2, sticky = tkinter.E, padx = 5, pady = 5)
@@ -128,7 +150,20 @@ class _CountriesSearchView(tkinter.LabelFrame, EventHandler):
 
     def _on_search_button_clicked(self):
         self.initiate_event(ClearCountriesSearchListEvent())
-        self.initiate_event(StartCountrySearchEvent(self._get_search_code(), self._get_search_name()))
+        self._search_criteria = (self._get_search_code(), self._get_search_name())
+        self._request_search_page(None)
+
+
+    def _request_search_page(self, continuation_token):
+        self._is_search_page_pending = True
+        self.initiate_event(StartCountrySearchPageEvent(
+            *self._search_criteria, _SEARCH_PAGE_SIZE, continuation_token))
+
+
+    def _on_search_list_scrolled(self, first, last):
+        if float(last) >= 1.0 and self._search_continuation_token is not None \
+                and not self._is_search_page_pending:
+            self._request_search_page(self._search_continuation_token)
 
 
     def _get_search_code(self):
@@ -153,9 +188,34 @@ class _CountriesSearchView(tkinter.LabelFrame, EventHandler):
             new_state = tkinter.DISABLED
 
         self._search_button['state'] = new_state
+
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+
+        self._search_after_id = self.after(_SEARCH_DELAY_MS, self._on_search_settled)
         return True
 
 
+    def _on_search_settled(self):
+        self._search_after_id = None
+
+        if not self.winfo_exists():
+            return
+
+        search_criteria = (self._get_search_code(), self._get_search_name())
+
+        if search_criteria == self._search_criteria or search_criteria == (None, None):
+            return
+
+        self._on_search_button_clicked()
+
+
+    def _add_search_results(self, countries):
+        display_names = [f'{country.country_code} - {country.name}' for country in countries]
+        self._search_list.insert(tkinter.END, *display_names)
+        self._search_country_ids.extend(country.country_id for country in countries)
+
+
     def _on_search_selection_changed(self, event):
         if event.widget.curselection():
             new_state = tkinter.NORMAL
@@ -180,11 +240,27 @@ class _CountriesSearchView(tkinter.LabelFrame, EventHandler):
         if isinstance(event, ClearCountriesSearchListEvent):
             self._search_list.delete(0, tkinter.END)
             self._search_country_ids = []
+            self._search_continuation_token = None
+            self._is_search_page_pending = False
             self._edit_button['state'] = tkinter.DISABLED
         elif isinstance(event, CountrySearchResultEvent):
-            display_name = f'{event.country().country_code} - {event.country().name}'
-            self._search_list.insert(tkinter.END, display_name)
-            self._search_country_ids.append(event.country().country_id)
+            self._add_search_results([event.country()])
+        elif isinstance(event, CountrySearchResultsBatchEvent):
+            self._add_search_results(event.countries())
+        elif isinstance(event, CountrySearchPageEvent):
+            self._add_search_results(event.countries())
+            self._search_continuation_token = event.continuation_token()
+            self._is_search_page_pending = False
+        elif isinstance(event, OperationCancelledEvent):
+            # a cancelled page ends the search, rather than being asked for again,
+            # and forgets its criteria, so that typing them again searches anew
+            if event.operation() == StartCountrySearchPageEvent.__name__:
+                self._search_criteria = None
+                self._search_continuation_token = None
+                self._is_search_page_pending = False
+        elif isinstance(event, ErrorEvent):
+            # a failed page can be asked for again by scrolling to the end once more
+            self._is_search_page_pending = False
 
 
 
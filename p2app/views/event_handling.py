@@ -7,13 +7,23 @@
 # (e.g., the events returned from the p2app.engine package, or events that are
 # internal to the user interface).
 #
-# YOU WILL NOT NEED TO MODIFY THIS FILE AT ALL
+# Each component lists the event types it handles in handled_events and
+# subscribes to them when it's created.  The outermost component keeps a
+# registry of subscribers by event type, so an event is delivered only to
+# the components that handle it, rather than to every widget on the screen.
+# Subscribers receive on_event in the order they subscribed (i.e., parents
+# before their children) and on_event_post in the reverse order.  A component
+# is removed from the registry as soon as it's destroyed, so views that have
+# been switched away from leave nothing behind.
 
 import tkinter
 
 
 
 class EventHandler:
+    handled_events = ()
+
+
     def initiate_event(self, event):
         widget = self
 
@@ -27,18 +37,56 @@ class EventHandler:
             widget.initiate_event(event)
 
 
+    def subscribe_events(self):
+        widget = self
+
+        while widget.master is not None:
+            widget = widget.master
+
+        if not hasattr(widget, '_subscriptions'):
+            widget._subscriptions = {}
+
+        for event_type in self.handled_events:
+            widget._subscriptions.setdefault(event_type, []).append(self)
+
+        if self.handled_events:
+            self.bind('<Destroy>', self._on_destroy_subscriber, add = '+')
+
+
+    def _on_destroy_subscriber(self, event):
+        # <Destroy> also reaches a toplevel when its children are destroyed
+        if str(event.widget) != str(self):
+            return
+
+        widget = self
+
+        while widget.master is not None:
+            widget = widget.master
+
+        subscriptions = getattr(widget, '_subscriptions', {})
+
+        for event_type in self.handled_events:
+            if self in subscriptions.get(event_type, []):
+                subscriptions[event_type].remove(self)
+
+
     def handle_event(self, event):
-        self.on_event(event)
+        subscriptions = getattr(self, '_subscriptions', {})
+
+        if type(event) not in subscriptions:
+            return
 
-        if isinstance(self, tkinter.Tk) or isinstance(self, tkinter.Widget):
-            for child in self.winfo_children():
-                if not child.winfo_exists():
-                    continue
+        # subscribers destroyed while the event is handled are removed from the
+        # registry, so the ones handling this event are copied first
+        subscribers = list(subscriptions[type(event)])
 
-                if isinstance(child, EventHandler):
-                    child.handle_event(event)
+        for subscriber in subscribers:
+            if subscriber.winfo_exists():
+                subscriber.on_event(event)
 
-        self.on_event_post(event)
+        for subscriber in reversed(subscribers):
+            if subscriber.winfo_exists():
+                subscriber.on_event_post(event)
 
 
     def on_event(self, event):
@@ -113,6 +113,36 @@ class DiscardRegionEvent(_InternalEvent):
 
 
 
+class ShowEditAirportsViewEvent(_InternalEvent):
+    def __init__(self):
+        super().__init__()
+
+
+
+class ClearAirportsSearchListEvent(_InternalEvent):
+    def __init__(self):
+        super().__init__()
+
+
+
+class NewAirportEvent(_InternalEvent):
+    def __init__(self):
+        super().__init__()
+
+
+
+class StartEditingAirportEvent(_InternalEvent):
+    def __init__(self):
+        super().__init__()
+
+
+
+class DiscardAirportEvent(_InternalEvent):
+    def __init__(self):
+        super().__init__()
+
+
+
 class EnableDebugModeEvent(_InternalEvent):
     def __init__(self):
         super().__init__()
@@ -10,6 +10,7 @@
 import tkinter
 import tkinter.messagebox
 from p2app.events import *
+from .airports import AirportsView
 from .continents import ContinentsView
 from .countries import CountriesView
 from .empty import EmptyView
@@ -28,8 +29,17 @@ _MISSING_DATABASE_NAME = '[no database open]'
 
 
 class MainView(tkinter.Tk, EventHandler):
+    handled_events = (
+        ShowEditContinentsViewEvent, ShowEditCountriesViewEvent, ShowEditRegionsViewEvent,
+        ShowEditAirportsViewEvent,
+        DatabaseOpenedEvent, DatabaseClosedEvent, DatabaseOpenFailedEvent,
+        EnableDebugModeEvent, DisableDebugModeEvent, EndApplicationEvent, ErrorEvent,
+        OperationCancelledEvent, ProfileExportedEvent)
+
+
     def __init__(self, event_bus):
         super().__init__()
+        self.subscribe_events()
         self.geometry(f'{_INITIAL_WINDOW_WIDTH}x{_INITIAL_WINDOW_HEIGHT}')
         self.config(menu = MainMenu(self))
         self._event_bus = event_bus
@@ -48,6 +58,7 @@ class MainView(tkinter.Tk, EventHandler):
     def run(self):
         self._switch_view(EmptyView(self))
         self._update_database_path(None)
+        self.initiate_event(CheckProfilingEvent())
         self.mainloop()
 
 
@@ -58,6 +69,8 @@ class MainView(tkinter.Tk, EventHandler):
             self._switch_view(CountriesView(self))
         elif isinstance(event, ShowEditRegionsViewEvent):
             self._switch_view(RegionsView(self))
+        elif isinstance(event, ShowEditAirportsViewEvent):
+            self._switch_view(AirportsView(self))
         elif isinstance(event, DatabaseOpenedEvent):
             self._update_database_path(event.path())
         elif isinstance(event, DatabaseClosedEvent):
@@ -78,6 +91,12 @@ class MainView(tkinter.Tk, EventHandler):
             self.destroy()
         elif isinstance(event, ErrorEvent):
             tkinter.messagebox.showerror('Error', event.message())
+        elif isinstance(event, OperationCancelledEvent) and event.reason() == 'Timed Out':
+            tkinter.messagebox.showwarning(
+                'Operation Timed Out',
+                f'{event.operation()} was stopped after {event.elapsed_seconds():.1f} seconds.')
+        elif isinstance(event, ProfileExportedEvent):
+            tkinter.messagebox.showinfo('Profile Exported', f'The profile was written to {event.path()}.')
 
 
     def _switch_view(self, view):
@@ -16,16 +16,24 @@ from .event_handling import EventHandler
 
 
 _OPEN_DATABASE_DIALOG_TITLE = 'Open Database'
+_EXPORT_PROFILE_DIALOG_TITLE = 'Export Profile'
+
+_PROFILE_FILE_TYPES = (('JSON', '*.json'), ('Prometheus text', '*.prom'))
+_PROMETHEUS_FILE_EXTENSIONS = ('.prom', '.txt')
 
 
 
 class BaseMenu(tkinter.Menu, EventHandler):
     def __init__(self, parent):
         super().__init__(parent, tearoff = 0)
+        self.subscribe_events()
 
 
 
 class MainMenu(BaseMenu):
+    handled_events = (DatabaseOpenedEvent, DatabaseClosedEvent)
+
+
     def __init__(self, parent):
         super().__init__(parent)
         self.add_cascade(label = 'File', menu = FileMenu(self))
@@ -41,10 +49,14 @@ class MainMenu(BaseMenu):
 
 
 class FileMenu(BaseMenu):
+    handled_events = (DatabaseOpenedEvent, DatabaseClosedEvent)
+
+
     def __init__(self, parent):
         super().__init__(parent)
         self.add_command(label = 'Open', state = tkinter.NORMAL, command = self._on_open)
         self.add_command(label = 'Close', state = tkinter.DISABLED, command = self._on_close)
+        self.add_command(label = 'Cancel Operation', state = tkinter.DISABLED, command = self._on_cancel)
         self.add_command(label = 'Exit', command = self._on_exit)
 
 
@@ -61,6 +73,10 @@ class FileMenu(BaseMenu):
         self.initiate_event(CloseDatabaseEvent())
 
 
+    def _on_cancel(self):
+        self.initiate_event(CancelOperationEvent())
+
+
     def _on_exit(self):
         self.initiate_event(QuitInitiatedEvent())
 
@@ -69,9 +85,11 @@ class FileMenu(BaseMenu):
         if isinstance(event, DatabaseOpenedEvent):
             self.entryconfig('Open', state = tkinter.DISABLED)
             self.entryconfig('Close', state = tkinter.NORMAL)
+            self.entryconfig('Cancel Operation', state = tkinter.NORMAL)
         elif isinstance(event, DatabaseClosedEvent):
             self.entryconfig('Open', state = tkinter.NORMAL)
             self.entryconfig('Close', state = tkinter.DISABLED)
+            self.entryconfig('Cancel Operation', state = tkinter.DISABLED)
 
 
 
@@ -81,6 +99,7 @@ class EditMenu(BaseMenu):
         self.add_command(label = 'Continents', command = self._on_edit_continents)
         self.add_command(label = 'Countries', command = self._on_edit_countries)
         self.add_command(label = 'Regions', command = self._on_edit_regions)
+        self.add_command(label = 'Airports', command = self._on_edit_airports)
 
 
     def _on_edit_continents(self):
@@ -95,20 +114,65 @@ class EditMenu(BaseMenu):
         self.initiate_event(ShowEditRegionsViewEvent())
 
 
+    def _on_edit_airports(self):
+        self.initiate_event(ShowEditAirportsViewEvent())
+
+
 
 class DebugMenu(BaseMenu):
+    handled_events = (ProfilingStateEvent,)
+
+
     def __init__(self, parent):
         super().__init__(parent)
 
         self._is_debug_mode = tkinter.IntVar(self, 0)
 
+        self._is_profiling = tkinter.IntVar(self, 0)
+
         self.add_checkbutton(
             label = 'Show Events', variable = self._is_debug_mode,
             command = self._on_change_show_events)
 
+        self.add_checkbutton(
+            label = 'Profile Engine', variable = self._is_profiling,
+            command = self._on_change_profile_engine)
+
+        self.add_command(label = 'Export Profile...', command = self._on_export_profile)
+
 
     def _on_change_show_events(self):
         if self._is_debug_mode.get():
             self.initiate_event(EnableDebugModeEvent())
         else:
             self.initiate_event(DisableDebugModeEvent())
+
+
+    def _on_change_profile_engine(self):
+        if self._is_profiling.get():
+            self.initiate_event(EnableProfilingEvent())
+        else:
+            self.initiate_event(DisableProfilingEvent())
+
+
+    def _on_export_profile(self):
+        export_path = tkinter.filedialog.asksaveasfilename(
+            title = _EXPORT_PROFILE_DIALOG_TITLE,
+            initialdir = Path.cwd(),
+            filetypes = _PROFILE_FILE_TYPES,
+            defaultextension = '.json')
+
+        if export_path:
+            export_path = Path(export_path)
+
+            if export_path.suffix.lower() in _PROMETHEUS_FILE_EXTENSIONS:
+                profile_format = 'prometheus'
+            else:
+                profile_format = 'json'
+
+            self.initiate_event(ExportProfileEvent(export_path, profile_format))
+
+
+    def on_event(self, event):
+        if isinstance(event, ProfilingStateEvent):
+            self._is_profiling.set(1 if event.is_enabled() else 0)
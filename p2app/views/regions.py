@@ -16,9 +16,20 @@ from .events import *
 
 
 
+_SEARCH_PAGE_SIZE = 100
+_SEARCH_DELAY_MS = 250
+
+
+
 class RegionsView(tkinter.Frame, EventHandler):
+    handled_events = (
+        SaveRegionFailedEvent, DiscardRegionEvent, NewRegionEvent, StartEditingRegionEvent,
+        RegionLoadedEvent, RegionSavedEvent)
+
+
     def __init__(self, parent):
         super().__init__(parent)
+        self.subscribe_events()
 
         search_view = _RegionsSearchView(self)
         search_view.grid(row = 0, column = 0, sticky = tkinter.NSEW)
@@ -60,8 +71,14 @@ class RegionsView(tkinter.Frame, EventHandler):
 
 
 class _RegionsSearchView(tkinter.LabelFrame, EventHandler):
+    handled_events = (
+        ClearRegionsSearchListEvent, RegionSearchResultEvent, RegionSearchResultsBatchEvent, RegionSearchPageEvent,
+        OperationCancelledEvent, ErrorEvent)
+
+
     def __init__(self, parent):
         super().__init__(parent, text = 'Region Search')
+        self.subscribe_events()
 
         region_code_label = tkinter.Label(self, text = 'Region Code: ')
         region_code_label.grid(row = 0, column = 0, padx = 5, pady = 5, sticky = tkinter.E)
@@ -101,7 +118,8 @@ class _RegionsSearchView(tkinter.LabelFrame, EventHandler):
 
         self._search_list = tkinter.Listbox(
             self, height = 4,
-            activestyle = tkinter.NONE, selectmode = tkinter.SINGLE)
+            activestyle = tkinter.NONE, selectmode = tkinter.SINGLE,
+            yscrollcommand = self._on_search_list_scrolled)
 
         self._search_list.bind('<<ListboxSelect>>', self._on_search_selection_changed)
         self._search_list.grid(
@@ -109,6 +127,10 @@ class _RegionsSearchView(tkinter.LabelFrame, EventHandler):
             padx = 5, pady = 5)
 
         self._search_region_ids = []
+        self._search_criteria = None
+        self._search_continuation_token = None
+        self._is_search_page_pending = False
+        self._search_after_id = None
 
         button_frame = tkinter.Frame(self)
         button_frame.grid(row = 5, column = 2, sticky = tkinter.E, padx = 5, pady = 5)
@@ -138,9 +160,22 @@ class _RegionsSearchView(tkinter.LabelFrame, EventHandler):
 
     def _on_search_button_clicked(self):
         self.initiate_event(ClearRegionsSearchListEvent())
-        self.initiate_event(StartRegionSearchEvent(
+        self._search_criteria = (
             self._get_search_region_code(), self._get_search_local_code(),
-            self._get_search_name()))
+            self._get_search_name())
+        self._request_search_page(None)
+
+
+    def _request_search_page(self, continuation_token):
+        self._is_search_page_pending = True
+        self.initiate_event(StartRegionSearchPageEvent(
+            *self._search_criteria, _SEARCH_PAGE_SIZE, continuation_token))
+
+
+    def _on_search_list_scrolled(self, first, last):
+        if float(last) >= 1.0 and self._search_continuation_token is not None \
+                and not self._is_search_page_pending:
+            self._request_search_page(self._search_continuation_token)
 
 
     def _get_search_region_code(self):
@@ -172,9 +207,36 @@ class _RegionsSearchView(tkinter.LabelFrame, EventHandler):
             new_state = tkinter.DISABLED
 
         self._search_button['state'] = new_state
+
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+
+        self._search_after_id = self.after(_SEARCH_DELAY_MS, self._on_search_settled)
         return True
 
 
+    def _on_search_settled(self):
+        self._search_after_id = None
+
+        if not self.winfo_exists():
+            return
+
+        search_criteria = (
+            self._get_search_region_code(), self._get_search_local_code(),
+            self._get_search_name())
+
+        if search_criteria == self._search_criteria or search_criteria == (None, None, None):
+            return
+
+        self._on_search_button_clicked()
+
+
+    def _add_search_results(self, regions):
+        display_names = [f'{region.region_code} - {region.name}' for region in regions]
+        self._search_list.insert(tkinter.END, *display_names)
+        self._search_region_ids.extend(region.region_id for region in regions)
+
+
     def _on_search_selection_changed(self, event):
         if event.widget.curselection():
             new_state = tkinter.NORMAL
@@ -199,11 +261,27 @@ class _RegionsSearchView(tkinter.LabelFrame, EventHandler):
         if isinstance(event, ClearRegionsSearchListEvent):
             self._search_list.delete(0, tkinter.END)
             self._search_region_ids = []
+            self._search_continuation_token = None
+            self._is_search_page_pending = False
             self._edit_button['state'] = tkinter.DISABLED
         elif isinstance(event, RegionSearchResultEvent):
-            display_name = f'{event.region().region_code} - {event.region().name}'
-            self._search_list.insert(tkinter.END, display_name)
-            self._search_region_ids.append(event.region().region_id)
+            self._add_search_results([event.region()])
+        elif isinstance(event, RegionSearchResultsBatchEvent):
+            self._add_search_results(event.regions())
+        elif isinstance(event, RegionSearchPageEvent):
+            self._add_search_results(event.regions())
+            self._search_continuation_token = event.continuation_token()
+            self._is_search_page_pending = False
+        elif isinstance(event, OperationCancelledEvent):
+            # a cancelled page ends the search, rather than being asked for again,
+            # and forgets its criteria, so that typing them again searches anew
+            if event.operation() == StartRegionSearchPageEvent.__name__:
+                self._search_criteria = None
+                self._search_continuation_token = None
+                self._is_search_page_pending = False
+        elif isinstance(event, ErrorEvent):
+            # a failed page can be asked for again by scrolling to the end once more
+            self._is_search_page_pending = False
 
 
 
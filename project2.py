@@ -10,11 +10,14 @@
 from p2app import EventBus
 from p2app import Engine
 from p2app import MainView
+from p2app.engine.utility_functions import FULL_TEXT_AVAILABLE
 
 
 def main():
-    event_bus = EventBus()
-    engine = Engine()
+    event_bus = EventBus(asynchronous = True)
+    # searched names match any record whose name has words starting with the
+    # searched ones (so 'Region 7' also finds 'Region 70'), not only exact names
+    engine = Engine(full_text_search = FULL_TEXT_AVAILABLE)
     main_view = MainView(event_bus)
 
     event_bus.register_engine(engine)
@@ -0,0 +1,171 @@
+# tests/test_engine_caches.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Checks the record and search caches that an engine keeps for each connection,
+# and that saving records assigns their ids and keeps the caches and the
+# geography snapshot up to date, using small databases built from schema.sql
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from p2app.engine import Engine
+from p2app.engine.utility_functions import record_cache_info, search_cache_info
+from p2app.events import *
+
+SCHEMA_PATH = Path(__file__).parent.parent / 'schema.sql'
+
+CONTINENTS = [(1, 'AF', 'Africa'), (2, 'EU', 'Europe')]
+COUNTRIES = [(1, 'KE', 'Kenya', 1, 'https://en.wikipedia.org/wiki/Kenya', None),
+             (2, 'FR', 'France', 2, 'https://en.wikipedia.org/wiki/France', 'French Republic'),
+             (3, 'IE', 'Ireland', 2, 'https://en.wikipedia.org/wiki/Ireland', None)]
+REGIONS = [(1, 'KE-01', '01', 'Baringo', 1, 1, None, None),
+           (2, 'FR-ARA', 'ARA', 'Auvergne-Rhone-Alpes', 2, 2, None, None),
+           (3, 'FR-BRE', 'BRE', 'Bretagne', 2, 2, None, 'Brittany')]
+
+
+def build_database(path: Path):
+    """Builds a database at path from schema.sql, holding a few continents, countries
+    and regions"""
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA_PATH.read_text())
+    connection.executemany('INSERT INTO continent VALUES (?, ?, ?);', CONTINENTS)
+    connection.executemany('INSERT INTO country VALUES (?, ?, ?, ?, ?, ?);', COUNTRIES)
+    connection.executemany('INSERT INTO region VALUES (?, ?, ?, ?, ?, ?, ?, ?);', REGIONS)
+    connection.commit()
+    connection.close()
+
+
+def get_countries(result_events: list) -> list:
+    """Gets the countries carried by the result events of a country search"""
+    return [country for result_event in result_events for country in result_event.countries()]
+
+
+
+class EngineTestCase(unittest.TestCase):
+    def setUp(self):
+        # cleanups run last first, so each engine closes its database before this runs
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.database_count = 0
+
+
+    def open_engine(self, **engine_options) -> Engine:
+        """Makes an engine with the given options and opens a new test database in it"""
+        self.database_count += 1
+        path = Path(self.directory.name) / f'airport{self.database_count}.db'
+        build_database(path)
+        engine = Engine(**engine_options)
+        [opened_event] = self.process(engine, OpenDatabaseEvent(path))
+        self.assertIsInstance(opened_event, DatabaseOpenedEvent)
+        self.addCleanup(self.process, engine, CloseDatabaseEvent())
+        return engine
+
+
+    def process(self, engine: Engine, event) -> list:
+        return list(engine.process_event(event))
+
+
+
+class EngineCacheTest(EngineTestCase):
+    def test_load_missing_record_fails(self):
+        for geography_snapshot in (False, True):
+            with self.subTest(geography_snapshot = geography_snapshot):
+                engine = self.open_engine(geography_snapshot = geography_snapshot)
+                [result_event] = self.process(engine, LoadCountryEvent(99))
+                self.assertIsInstance(result_event, ErrorEvent)
+                self.assertEqual(result_event.message(), 'Load Country Failed')
+
+
+    def test_record_cache_counts_hits_and_misses(self):
+        engine = self.open_engine(record_cache_size = 2)
+        for country_id in (1, 1, 2, 3, 1):
+            [result_event] = self.process(engine, LoadCountryEvent(country_id))
+            self.assertEqual(result_event.country(), Country(*COUNTRIES[country_id - 1]))
+
+        # the second load of 1 is a hit; loading 2 and 3 evicts 1 before its third load
+        self.assertEqual(record_cache_info(engine.connection),
+                         {'hits': 1, 'misses': 4, 'hit_rate': 0.2, 'size': 2, 'max_size': 2})
+
+
+    def test_search_cache_counts_hits_and_misses(self):
+        engine = self.open_engine()
+        first_countries = get_countries(self.process(engine, StartCountrySearchEvent(None, 'France')))
+        second_countries = get_countries(self.process(engine, StartCountrySearchEvent(None, 'France')))
+        self.assertEqual(first_countries, [Country(*COUNTRIES[1])])
+        self.assertEqual(second_countries, first_countries)
+        self.assertEqual(search_cache_info(engine.connection),
+                         {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'entries': 1, 'rows': 1})
+
+
+    def test_engines_keep_separate_caches(self):
+        first_engine = self.open_engine()
+        second_engine = self.open_engine()
+        self.process(first_engine, LoadCountryEvent(1))
+        self.process(first_engine, LoadCountryEvent(1))
+        self.assertEqual(record_cache_info(first_engine.connection)['hits'], 1)
+        self.assertEqual(record_cache_info(second_engine.connection)['hits'], 0)
+
+
+
+class EngineSaveTest(EngineTestCase):
+    def test_batch_save_assigns_new_ids(self):
+        for geography_snapshot in (False, True):
+            with self.subTest(geography_snapshot = geography_snapshot):
+                engine = self.open_engine(geography_snapshot = geography_snapshot)
+                updated_country = Country(2, 'FR', 'French Republic', 2, 'https://en.wikipedia.org/wiki/France', None)
+                new_countries = [Country(None, 'ES', 'Spain', 2, 'https://en.wikipedia.org/wiki/Spain', None),
+                                 Country(None, 'TZ', 'Tanzania', 1, 'https://en.wikipedia.org/wiki/Tanzania', None)]
+                taken_country = Country(None, 'KE', 'Kenya Again', 1, 'https://en.wikipedia.org/wiki/Kenya', None)
+
+                [saved_event] = self.process(engine, SaveCountriesEvent(
+                    (new_countries[0], updated_country, taken_country, new_countries[1])))
+
+                self.assertIsInstance(saved_event, CountriesSavedEvent)
+                self.assertEqual(sorted(saved_event.countries()),
+                                 [updated_country, new_countries[0]._replace(country_id = 4),
+                                  new_countries[1]._replace(country_id = 5)])
+                self.assertEqual([country for country, _ in saved_event.failures()], [taken_country])
+
+                for country in sorted(saved_event.countries()):
+                    [loaded_event] = self.process(engine, LoadCountryEvent(country.country_id))
+                    self.assertEqual(loaded_event.country(), country)
+
+
+    def test_saved_records_replace_cached_ones(self):
+        engine = self.open_engine()
+        self.process(engine, LoadCountryEvent(2))
+        self.process(engine, StartCountrySearchEvent(None, 'France'))
+        self.process(engine, StartCountrySearchPageEvent(None, 'France', 10))
+
+        renamed_country = Country(2, 'FR', 'Francia', 2, 'https://en.wikipedia.org/wiki/France', None)
+        [saved_event] = self.process(engine, SaveCountryEvent(renamed_country))
+        self.assertEqual(saved_event.country(), renamed_country)
+
+        [loaded_event] = self.process(engine, LoadCountryEvent(2))
+        self.assertEqual(loaded_event.country(), renamed_country)
+        self.assertEqual(get_countries(self.process(engine, StartCountrySearchEvent(None, 'France'))), [])
+        [page_event] = self.process(engine, StartCountrySearchPageEvent(None, 'France', 10))
+        self.assertEqual(page_event.countries(), ())
+        self.assertEqual(get_countries(self.process(engine, StartCountrySearchEvent(None, 'Francia'))),
+                         [renamed_country])
+
+
+    def test_snapshot_search_after_insert(self):
+        engine = self.open_engine(geography_snapshot = True)
+        self.assertEqual(get_countries(self.process(engine, StartCountrySearchEvent('ES', None))), [])
+
+        new_country = Country(None, 'ES', 'Spain', 2, 'https://en.wikipedia.org/wiki/Spain', None)
+        [saved_event] = self.process(engine, SaveNewCountryEvent(new_country))
+        saved_country = new_country._replace(country_id = 4)
+        self.assertEqual(saved_event.country(), saved_country)
+
+        self.assertEqual(get_countries(self.process(engine, StartCountrySearchEvent('ES', None))), [saved_country])
+        self.assertEqual(get_countries(self.process(engine, StartCountrySearchEvent(None, 'Spain'))), [saved_country])
+        [page_event] = self.process(engine, StartCountrySearchPageEvent(None, 'Spain', 10))
+        self.assertEqual(page_event.countries(), (saved_country,))
+        [loaded_event] = self.process(engine, LoadCountryEvent(4))
+        self.assertEqual(loaded_event.country(), saved_country)
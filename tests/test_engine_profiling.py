@@ -0,0 +1,47 @@
+# tests/test_engine_profiling.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Checks that each engine's profiler records only the events, SQL and rows of
+# that engine
+
+from p2app.events import *
+from tests.test_engine_caches import EngineTestCase
+
+
+
+class EngineProfilingTest(EngineTestCase):
+    def get_figures(self, engine) -> dict:
+        """Gets the count, rows returned and rows converted for each profiled event type"""
+        return {entry['event_type']: (entry['count'], entry['rows_returned'], entry['rows_converted'])
+                for entry in engine.profiler.report()}
+
+
+    def test_engines_keep_separate_profiles(self):
+        first_engine = self.open_engine(profiling = True)
+        second_engine = self.open_engine(profiling = True)
+
+        # the second engine loads a region while the first one's search is under way
+        search_results = first_engine.process_event(StartRegionSearchEvent(None, None, 'Bretagne'))
+        next(search_results)
+        self.process(second_engine, LoadRegionEvent(1))
+        list(search_results)
+
+        self.assertEqual(self.get_figures(first_engine)['StartRegionSearchEvent'], (1, 1, 1))
+        self.assertNotIn('LoadRegionEvent', self.get_figures(first_engine))
+        self.assertEqual(self.get_figures(second_engine)['LoadRegionEvent'], (1, 1, 1))
+        self.assertNotIn('StartRegionSearchEvent', self.get_figures(second_engine))
+
+
+    def test_disabling_one_profiler_leaves_the_others_enabled(self):
+        first_engine = self.open_engine(profiling = True)
+        second_engine = self.open_engine(profiling = True)
+        self.process(second_engine, DisableProfilingEvent())
+
+        self.process(first_engine, LoadRegionEvent(2))
+        self.process(second_engine, LoadRegionEvent(2))
+
+        self.assertTrue(first_engine.profiler.is_enabled())
+        self.assertEqual(self.get_figures(first_engine)['LoadRegionEvent'], (1, 1, 1))
+        self.assertNotIn('LoadRegionEvent', self.get_figures(second_engine))
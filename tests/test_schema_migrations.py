@@ -0,0 +1,111 @@
+# tests/test_schema_migrations.py
+#
+# ICS 33 Fall 2024
+# Project 2: Learning to Fly
+#
+# Checks, with EXPLAIN QUERY PLAN, that once the schema is migrated every search
+# and search page is answered from an index rather than by scanning its table
+
+import itertools
+import sqlite3
+import unittest
+from pathlib import Path
+
+from p2app.engine.utility_functions.full_text import FULL_TEXT_AVAILABLE, ensure_full_text_index
+from p2app.engine.utility_functions.schema_migrations import SCHEMA_INDEXES, migrate_schema
+from p2app.engine.utility_functions.sql_statements import FULL_TEXT_FILTER, get_statement
+
+SCHEMA_PATH = Path(__file__).parent.parent / 'schema.sql'
+
+# the columns each search event can filter by, in the order the engine reads them
+SEARCHED_COLUMNS = {'continent': ('continent_code', 'name'),
+                    'country': ('country_code', 'name'),
+                    'region': ('region_code', 'local_code', 'name'),
+                    'airport': ('airport_ident', 'iata_code', 'gps_code', 'country_id', 'region_id', 'name')}
+
+
+def get_filter_shapes(geo_scope: str, full_text: bool) -> list:
+    """Gets every filter shape a search of the table can have, with the name matched
+    by the full-text index if full_text is set"""
+    columns = SEARCHED_COLUMNS[geo_scope]
+    filter_shapes = list()
+    for column_count in range(len(columns) + 1):
+        for filter_shape in itertools.combinations(columns, column_count):
+            if full_text:
+                if 'name' not in filter_shape:
+                    continue
+                filter_shape = tuple([FULL_TEXT_FILTER if column == 'name' else column for column in filter_shape])
+            filter_shapes.append(filter_shape)
+    return filter_shapes
+
+
+def get_query_plan(operation: str, geo_scope: str, filter_shape: tuple, connection) -> list:
+    """Gets the details of each step of the query plan for a search statement"""
+    statement = get_statement(operation, geo_scope, filter_shape)
+    cursor = connection.execute('EXPLAIN QUERY PLAN ' + statement, ['x'] * statement.count('?'))
+    query_plan = [row[3] for row in cursor.fetchall()]
+    cursor.close()
+    return query_plan
+
+
+
+class SchemaMigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.executescript(SCHEMA_PATH.read_text())
+        self.assertEqual(migrate_schema(self.connection), 'applied')
+
+
+    def tearDown(self):
+        self.connection.close()
+
+
+    def test_migration_creates_every_index(self):
+        cursor = self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'index';")
+        index_names = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+        self.assertLessEqual(set(SCHEMA_INDEXES), index_names)
+
+
+    def test_migration_is_idempotent(self):
+        self.assertEqual(migrate_schema(self.connection), 'applied')
+
+
+    def test_searches_use_indexes(self):
+        for geo_scope in SEARCHED_COLUMNS:
+            for filter_shape in get_filter_shapes(geo_scope, False):
+                for operation in ('search', 'search_page'):
+                    # a search with no criteria reads the whole table by design
+                    if operation == 'search' and not filter_shape:
+                        continue
+                    with self.subTest(operation = operation, geo_scope = geo_scope, filter_shape = filter_shape):
+                        self.assert_indexed(get_query_plan(operation, geo_scope, filter_shape, self.connection))
+
+
+    @unittest.skipUnless(FULL_TEXT_AVAILABLE, 'SQLite was built without FTS5')
+    def test_full_text_searches_use_indexes(self):
+        for geo_scope in SEARCHED_COLUMNS:
+            ensure_full_text_index(geo_scope, self.connection)
+            for filter_shape in get_filter_shapes(geo_scope, True):
+                for operation in ('search', 'search_page'):
+                    # ranked pages continue from (rank, id), so their matches are sorted
+                    # by both, just as FTS5 sorts every match by rank for a ranked search
+                    with self.subTest(operation = operation, geo_scope = geo_scope, filter_shape = filter_shape):
+                        self.assert_indexed(get_query_plan(operation, geo_scope, filter_shape, self.connection),
+                                            operation == 'search_page')
+
+
+    def assert_indexed(self, query_plan: list, is_sorted: bool = False):
+        """Checks that each table in a query plan is searched through an index (or, for
+        a full-text index, by its MATCH), and that no results are sorted afterward
+        unless is_sorted is set"""
+        for step in query_plan:
+            if 'TEMP B-TREE' in step:
+                self.assertTrue(is_sorted, step)
+            elif 'VIRTUAL TABLE' in step:
+                # FTS5 reports its plan as INDEX <flags>:<constraints>, with an M for each MATCH
+                self.assertRegex(step, r'VIRTUAL TABLE INDEX \d+:\S*M')
+            else:
+                self.assertNotIn('SCAN', step)
+                self.assertTrue('USING INDEX' in step or 'USING COVERING INDEX' in step or
+                                'USING INTEGER PRIMARY KEY' in step, step)